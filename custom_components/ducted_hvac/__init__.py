@@ -9,22 +9,54 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 
 import voluptuous as vol
 
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.climate.const import HVACMode
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
-from homeassistant.const import CONF_NAME, CONF_UNIQUE_ID, Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+    CONF_NAME,
+    CONF_UNIQUE_ID,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, State, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 
+from .planner import (
+    MotorCapabilities,
+    MotorCommand,
+    command_satisfied_by,
+    plan_motor_commands,
+)
+from .preset import PresetManager
+from .ratelimit import MotorCommandQueue
+from .resilience import CircuitOpenError, ServiceCaller
+from .router import ZoneEventRouter
+from .schedule import ZoneScheduler
+from .thermal import ThermalRateLearner, async_remove_rates
+from .vent import VentActuator, VentCommandGate
+from .zone_index import ZoneIndex
+
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "ducted_hvac"
 
+# hass.data key for the VentCommandGate shared by all config entries
+DATA_VENT_GATE = f"{DOMAIN}_vent_gate"
+
 CONF_MOTOR = "motor"
 CONF_MODES = "modes"
 CONF_ZONES = "zones"
@@ -36,12 +68,77 @@ CONF_TEMP_STEP = "temp_step"
 CONF_TOLERANCE = "tolerance"
 CONF_MIN_CYCLE_DURATION = "min_cycle_duration"
 CONF_FAN_MODES = "fan_modes"
+CONF_SYNC_QUIET_WINDOW = "sync_quiet_window"
+CONF_SYNC_MAX_DELAY = "sync_max_delay"
+CONF_VENT_BATCH_WINDOW = "vent_batch_window"
+CONF_SENSOR_PRECISION = "sensor_precision"
+CONF_SENSOR_MIN_DELTA = "sensor_min_delta"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_MOTOR_DISPATCH = "motor_dispatch"
+CONF_MOTOR_CONFIRM_TIMEOUT = "motor_confirm_timeout"
+CONF_CALL_TIMEOUT = "call_timeout"
+CONF_CALL_RETRIES = "call_retries"
+CONF_BREAKER_THRESHOLD = "breaker_threshold"
+CONF_BREAKER_RESET = "breaker_reset"
+CONF_MOTOR_COMMAND_INTERVAL = "motor_command_interval"
+CONF_MOTOR_COMMAND_BURST = "motor_command_burst"
+CONF_VENT_MAX_IN_FLIGHT = "vent_max_in_flight"
+CONF_DRIFT_RECONCILE_INTERVAL = "drift_reconcile_interval"
+CONF_DRIFT_GRACE = "drift_grace"
+CONF_PRESETS = "presets"
+CONF_SCHEDULES = "schedules"
+CONF_OPTIMAL_START_MAX = "optimal_start_max"
+CONF_VENT_ANTICIPATION = "vent_anticipation"
+CONF_VENT_COMMAND_SPACING = "vent_command_spacing"
 
 DEFAULT_MIN_TEMP = 16.0
 DEFAULT_MAX_TEMP = 30.0
 DEFAULT_TEMP_STEP = 0.5
 DEFAULT_TOLERANCE = 0.3
 DEFAULT_FAN_MODES = ["auto", "low", "medium", "high"]
+DEFAULT_SYNC_QUIET_WINDOW = 0.25
+DEFAULT_SYNC_MAX_DELAY = 2.0
+DEFAULT_VENT_BATCH_WINDOW = 0.0
+DEFAULT_SENSOR_PRECISION = 0.0
+DEFAULT_SENSOR_MIN_DELTA = 0.0
+DEFAULT_SENSOR_MIN_INTERVAL = 0.0
+DEFAULT_MOTOR_CONFIRM_TIMEOUT = 10.0
+DEFAULT_CALL_TIMEOUT = 15.0
+DEFAULT_CALL_RETRIES = 2
+DEFAULT_BREAKER_THRESHOLD = 3
+DEFAULT_BREAKER_RESET = 60.0
+DEFAULT_MOTOR_COMMAND_INTERVAL = 0.0
+DEFAULT_MOTOR_COMMAND_BURST = 1
+DEFAULT_VENT_MAX_IN_FLIGHT = 0
+DEFAULT_VENT_COMMAND_SPACING = 0.0
+DEFAULT_DRIFT_RECONCILE_INTERVAL = 30.0
+DEFAULT_DRIFT_GRACE = 5.0
+DEFAULT_OPTIMAL_START_MAX = 0  # minutes; 0 disables optimal start
+DEFAULT_VENT_ANTICIPATION = 0.0  # seconds of lag to project over; 0 disables it
+
+# Global settings the update listener pushes to running zones
+_SETTINGS_KEYS = {
+    CONF_MODES,
+    CONF_FAN_MODES,
+    CONF_MIN_TEMP,
+    CONF_MAX_TEMP,
+    CONF_TEMP_STEP,
+    CONF_TOLERANCE,
+    CONF_MIN_CYCLE_DURATION,
+}
+
+# Entry data keys the update listener applies without reloading the entry
+_LIVE_KEYS = _SETTINGS_KEYS | {CONF_NAME, CONF_ZONES, CONF_SCHEDULES}
+
+# Seconds to wait for every configured zone to register before starting anyway
+STARTUP_TIMEOUT = 30.0
+
+# Motor dispatch modes: await each call in turn, or send without blocking and
+# confirm each command by watching the motor entity's state
+MOTOR_DISPATCH_SEQUENTIAL = "sequential"
+MOTOR_DISPATCH_PIPELINED = "pipelined"
+MOTOR_DISPATCH_MODES = [MOTOR_DISPATCH_SEQUENTIAL, MOTOR_DISPATCH_PIPELINED]
+DEFAULT_MOTOR_DISPATCH = MOTOR_DISPATCH_SEQUENTIAL
 
 DEFAULT_MODES = [
     HVACMode.OFF,
@@ -102,6 +199,22 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+SERVICE_SET_ZONES = "set_zones"
+ATTR_HVAC_MODE = "hvac_mode"
+ATTR_FAN_MODE = "fan_mode"
+
+SET_ZONES_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional(ATTR_HVAC_MODE): vol.In([m.value for m in VALID_MODES]),
+            vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+            vol.Optional(ATTR_FAN_MODE): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_HVAC_MODE, ATTR_TEMPERATURE, ATTR_FAN_MODE),
+)
+
+
 def build_device_info(entry: ConfigEntry) -> DeviceInfo:
     """Return the shared DeviceInfo for all entities in this config entry."""
     return DeviceInfo(
@@ -113,7 +226,15 @@ def build_device_info(entry: ConfigEntry) -> DeviceInfo:
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """YAML backward compatibility: auto-import YAML config as a config entry."""
+    """Register services; YAML backward compatibility: auto-import YAML config."""
+
+    async def _async_set_zones(call: ServiceCall) -> None:
+        await _async_handle_set_zones(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_ZONES, _async_set_zones, schema=SET_ZONES_SCHEMA
+    )
+
     domain_config = config.get(DOMAIN)
     if domain_config is None:
         return True
@@ -167,58 +288,306 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ducted_hvac from a config entry."""
     data = entry.data
 
-    modes = [HVACMode(m) for m in data[CONF_MODES]]
-    if HVACMode.OFF not in modes:
-        modes.insert(0, HVACMode.OFF)
+    modes = _entry_modes(data)
 
-    coordinator = MotorCoordinator(hass, data[CONF_MOTOR])
+    caller = ServiceCaller(
+        hass,
+        timeout=data.get(CONF_CALL_TIMEOUT, DEFAULT_CALL_TIMEOUT),
+        retries=int(data.get(CONF_CALL_RETRIES, DEFAULT_CALL_RETRIES)),
+        failure_threshold=int(data.get(CONF_BREAKER_THRESHOLD, DEFAULT_BREAKER_THRESHOLD)),
+        reset_timeout=data.get(CONF_BREAKER_RESET, DEFAULT_BREAKER_RESET),
+    )
+    coordinator = MotorCoordinator(
+        hass,
+        data[CONF_MOTOR],
+        caller,
+        quiet_window=data.get(CONF_SYNC_QUIET_WINDOW, DEFAULT_SYNC_QUIET_WINDOW),
+        max_delay=data.get(CONF_SYNC_MAX_DELAY, DEFAULT_SYNC_MAX_DELAY),
+        dispatch=data.get(CONF_MOTOR_DISPATCH, DEFAULT_MOTOR_DISPATCH),
+        confirm_timeout=data.get(CONF_MOTOR_CONFIRM_TIMEOUT, DEFAULT_MOTOR_CONFIRM_TIMEOUT),
+        command_interval=data.get(CONF_MOTOR_COMMAND_INTERVAL, DEFAULT_MOTOR_COMMAND_INTERVAL),
+        command_burst=int(data.get(CONF_MOTOR_COMMAND_BURST, DEFAULT_MOTOR_COMMAND_BURST)),
+        reconcile_interval=data.get(
+            CONF_DRIFT_RECONCILE_INTERVAL, DEFAULT_DRIFT_RECONCILE_INTERVAL
+        ),
+        drift_grace=data.get(CONF_DRIFT_GRACE, DEFAULT_DRIFT_GRACE),
+        expected_zones=len(data.get(CONF_ZONES, [])),
+    )
+    coordinator.async_start()
 
     fan_modes: list[str] = data.get(CONF_FAN_MODES, [])
 
+    gate: VentCommandGate = hass.data.setdefault(DATA_VENT_GATE, VentCommandGate(hass))
+    gate.async_register(
+        entry.entry_id,
+        int(data.get(CONF_VENT_MAX_IN_FLIGHT, DEFAULT_VENT_MAX_IN_FLIGHT)),
+        data.get(CONF_VENT_COMMAND_SPACING, DEFAULT_VENT_COMMAND_SPACING),
+    )
+
+    presets = PresetManager(hass, coordinator, dict(data.get(CONF_PRESETS, {})))
+    thermal = ThermalRateLearner(hass, entry.entry_id)
+    await thermal.async_load()
+    scheduler = ZoneScheduler(
+        hass,
+        coordinator,
+        presets,
+        thermal,
+        dict(data.get(CONF_SCHEDULES, {})),
+        max_lead=timedelta(
+            minutes=data.get(CONF_OPTIMAL_START_MAX, DEFAULT_OPTIMAL_START_MAX)
+        ),
+    )
+
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
+        "router": ZoneEventRouter(hass),
+        "caller": caller,
+        "actuator": VentActuator(
+            hass,
+            coordinator,
+            caller,
+            gate,
+            window=data.get(CONF_VENT_BATCH_WINDOW, DEFAULT_VENT_BATCH_WINDOW),
+        ),
+        "presets": presets,
+        "scheduler": scheduler,
+        "thermal": thermal,
         "config": data,
         "modes": modes,
         "fan_modes": fan_modes,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    scheduler.async_start()
+    entry.async_on_unload(entry.add_update_listener(_async_entry_updated))
     return True
 
 
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply options-flow changes live where possible, otherwise reload the entry.
+
+    Zone edits and global settings are pushed to the running entities; a new
+    motor entity or changed advanced tuning needs a reload.
+    """
+    domain_data = hass.data[DOMAIN].get(entry.entry_id)
+    if domain_data is None:
+        return
+    old, new = domain_data["config"], entry.data
+    changed = {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+    if not changed:
+        return
+    if not changed <= _LIVE_KEYS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    domain_data["config"] = new
+    domain_data["modes"] = _entry_modes(new)
+    domain_data["fan_modes"] = new.get(CONF_FAN_MODES, [])
+    if changed & _SETTINGS_KEYS:
+        await domain_data["apply_settings"]()
+    if CONF_ZONES in changed:
+        await domain_data["apply_zones"](new[CONF_ZONES])
+    if CONF_SCHEDULES in changed:
+        domain_data["scheduler"].async_update(new.get(CONF_SCHEDULES, {}))
+
+
+async def _async_handle_set_zones(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Apply one mode/setpoint/fan change to many zones with one sync per system."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_ids = selected.referenced | selected.indirectly_referenced
+
+    batches: list[tuple[MotorCoordinator, list]] = []
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        coordinator: MotorCoordinator = entry_data["coordinator"]
+        if zones := [z for z in coordinator.zones if z.entity_id in entity_ids]:
+            batches.append((coordinator, zones))
+    if not batches:
+        raise ServiceValidationError("No Ducted HVAC zones match the service target")
+
+    hvac_mode = call.data.get(ATTR_HVAC_MODE)
+    fan_mode = call.data.get(ATTR_FAN_MODE)
+    # Validate every zone before changing any, so the call applies all or nothing
+    for _, zones in batches:
+        for zone in zones:
+            if hvac_mode is not None and hvac_mode not in zone.hvac_modes:
+                raise ServiceValidationError(f"{zone.entity_id} does not support mode {hvac_mode}")
+            if fan_mode is not None and fan_mode not in (zone.fan_modes or []):
+                raise ServiceValidationError(
+                    f"{zone.entity_id} does not support fan mode {fan_mode}"
+                )
+
+    await asyncio.gather(
+        *(
+            coordinator.async_set_zones(
+                zones,
+                HVACMode(hvac_mode) if hvac_mode is not None else None,
+                call.data.get(ATTR_TEMPERATURE),
+                fan_mode,
+            )
+            for coordinator, zones in batches
+        )
+    )
+
+
+def _entry_modes(data) -> list[HVACMode]:
+    """Return the entry's HVAC modes, always including OFF."""
+    modes = [HVACMode(m) for m in data[CONF_MODES]]
+    if HVACMode.OFF not in modes:
+        modes.insert(0, HVACMode.OFF)
+    return modes
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        domain_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if domain_data is not None:
+            domain_data["scheduler"].async_shutdown()
+            domain_data["coordinator"].async_shutdown()
+            domain_data["router"].async_shutdown()
+            domain_data["actuator"].async_shutdown()
+            domain_data["caller"].async_shutdown()
+            # Nothing may be left to write once the entry could be removed
+            await domain_data["thermal"].async_flush()
+        hass.data[DATA_VENT_GATE].async_unregister(entry.entry_id)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's learned thermal rates when it is removed."""
+    await async_remove_rates(hass, entry.entry_id)
+
+
 class MotorCoordinator:
     """Watches all zone entities and syncs the central motor unit.
 
-    Zones register themselves during async_added_to_hass. Whenever any zone's
+    Zones register themselves during async_added_to_hass. Until Home Assistant
+    has started and all ``expected_zones`` have registered (or STARTUP_TIMEOUT
+    passes), zone changes only update the index. The coordinator then runs
+    every zone's startup check in one batch, waits for the resulting vent
+    commands and issues a single motor sync.
+
+    After startup, whenever any zone's
     vent state or mode changes, it calls async_zone_changed() which schedules
-    a debounced motor sync.
+    a coalesced motor sync: the sync runs once no change has arrived for
+    ``quiet_window`` seconds, but never later than ``max_delay`` seconds after
+    the first change of the burst.
+
+    Syncs run in a single loop task guarded by a dirty flag. A request that
+    arrives while a pass is in flight queues exactly one follow-up pass, so
+    the motor always ends up matching the latest zone state.
+
+    With a command interval set, every motor command passes through a
+    token-bucket MotorCommandQueue that keeps only the latest intent per
+    attribute.
+
+    In pipelined dispatch the mode command is sent without blocking and
+    confirmed by the motor's next state change; setpoint and fan commands then
+    go out concurrently, each confirmed the same way within confirm_timeout.
+
+    The motor's capabilities (modes, fan modes, setpoint range and step) are
+    cached from its state and refreshed on every motor state change. Setpoints
+    are quantised and clamped to them, and unsupported modes are never sent.
+
+    The motor's actual state is compared with the last desired state. When
+    they disagree for longer than drift_grace (wall remote, lost command) a
+    reconciliation pass re-syncs the motor, at most once per reconcile_interval.
+    After each sync the motor gets a confirm window of drift_grace to report
+    the new state, so motors that only show a command on their next poll are
+    not mistaken for drifted.
     """
 
-    def __init__(self, hass: HomeAssistant, motor_entity_id: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        motor_entity_id: str,
+        caller: ServiceCaller,
+        quiet_window: float = DEFAULT_SYNC_QUIET_WINDOW,
+        max_delay: float = DEFAULT_SYNC_MAX_DELAY,
+        dispatch: str = DEFAULT_MOTOR_DISPATCH,
+        confirm_timeout: float = DEFAULT_MOTOR_CONFIRM_TIMEOUT,
+        command_interval: float = DEFAULT_MOTOR_COMMAND_INTERVAL,
+        command_burst: int = DEFAULT_MOTOR_COMMAND_BURST,
+        reconcile_interval: float = DEFAULT_DRIFT_RECONCILE_INTERVAL,
+        drift_grace: float = DEFAULT_DRIFT_GRACE,
+        expected_zones: int = 0,
+    ) -> None:
         self._hass = hass
         self._motor_entity_id = motor_entity_id
+        self._caller = caller
+        self._dispatch = dispatch
+        self._confirm_timeout = confirm_timeout
+        self._limiter = (
+            MotorCommandQueue(hass, command_interval, command_burst)
+            if command_interval > 0
+            else None
+        )
+        self._unsub_motor = None
+        # Last known motor capabilities; kept while the motor is unavailable
+        self._capabilities = MotorCapabilities()
+        # Pending confirmations: (predicate over the motor State, future)
+        self._motor_waiters: list[tuple[Callable[[State], bool], asyncio.Future]] = []
         self._zones: list = []  # list[DuctedHVACZone], typed loosely to avoid circular import
+        self._index = ZoneIndex()
         self._pending_sync: asyncio.Task | None = None
+        # Set whenever zone state changed after the running sync pass read it
+        self._sync_requested = False
+        # Set on every sync request; wakes a pass waiting on the rate limiter
+        self._sync_wakeup = asyncio.Event()
+
+        # Coalescing scheduler
+        self._quiet_window = quiet_window
+        self._max_delay = max(max_delay, quiet_window)
+        self._burst_started: float | None = None  # loop time of the first change in a burst
+        self._latency_origin: float | None = None  # first unsynced change, for latency metrics
+        self._last_sync_latency: float | None = None  # seconds
+        self._unsub_sync_timer = None
 
         # State tracked for coordinator sensor
         self._last_active_mode: str | None = None
         self._last_motor_temp: float | None = None
         self._last_fan_mode: str | None = None  # last fan mode set by any zone
+        self._unsupported_modes: set[str] = set()  # already warned about
         self._sensor = None  # MotorCoordinatorSensor, injected via register_sensor()
 
+        # Planner counters
+        self._commands_sent = 0
+        self._commands_skipped = 0
+
+        # Drift reconciliation
+        self._reconcile_interval = reconcile_interval
+        self._drift_grace = drift_grace
+        self._confirm_until = -math.inf  # loop time our last sync's confirm window ends
+        self._unsub_confirm_timer = None
+        self._desired: tuple[str | None, float | None, str | None] | None = None
+        self._drift_started: float | None = None  # loop time drift was first seen
+        self._drift_reconciled = False  # a reconcile pass ran for the current drift
+        self._last_reconcile = -math.inf
+        self._unsub_reconcile_timer = None
+        self._drift_count = 0
+        self._last_converge_time: float | None = None  # seconds
+
+        # Startup barrier
+        self._expected_zones = expected_zones
+        self._starting = True  # zone changes only re-index until the barrier releases
+        self._hass_started = False
+        self._startup_began: float | None = None  # loop time, for startup_duration
+        self._startup_duration: float | None = None  # seconds
+        self._startup_task: asyncio.Task | None = None
+        self._unsub_started = None
+        self._unsub_startup_timer = None
+
     @property
     def zones(self) -> list:
         """All registered zone entities."""
         return self._zones
 
+    @property
+    def open_zone_count(self) -> int:
+        """Number of registered zones whose vent is open."""
+        return self._index.open_count
+
     @property
     def last_active_mode(self) -> str | None:
         """Mode last commanded to the motor, or None if motor is off."""
@@ -234,9 +603,80 @@ class MotorCoordinator:
         """Fan mode last commanded to the motor, or None."""
         return self._last_fan_mode
 
+    @property
+    def commands_sent(self) -> int:
+        """Number of motor service calls actually sent."""
+        return self._commands_sent
+
+    @property
+    def commands_skipped(self) -> int:
+        """Number of motor service calls skipped because the motor already matched."""
+        return self._commands_skipped
+
+    @property
+    def circuit_states(self) -> dict[str, str]:
+        """Motor and vent circuit breakers that are not closed, keyed by entity ID."""
+        return self._caller.breaker_states
+
+    @property
+    def motor_queue_depth(self) -> int:
+        """Motor commands waiting for the rate limiter."""
+        return self._limiter.depth if self._limiter is not None else 0
+
+    @property
+    def motor_commands_merged(self) -> int:
+        """Queued motor commands replaced by a newer one for the same attribute."""
+        return self._limiter.merged if self._limiter is not None else 0
+
+    @property
+    def motor_commands_dropped(self) -> int:
+        """Queued motor commands discarded by a turn_off or mode change."""
+        return self._limiter.dropped if self._limiter is not None else 0
+
+    @property
+    def last_sync_latency(self) -> float | None:
+        """Seconds from the first zone change to the completed motor sync."""
+        return self._last_sync_latency
+
+    @property
+    def startup_duration(self) -> float | None:
+        """Seconds from coordinator start to the first completed motor sync."""
+        return self._startup_duration
+
+    @property
+    def motor_drifted(self) -> bool:
+        """True while the motor disagrees with the desired state."""
+        return self._drift_started is not None
+
+    @property
+    def drift_count(self) -> int:
+        """Times the motor drifted from the desired state and was reconciled."""
+        return self._drift_count
+
+    @property
+    def last_converge_time(self) -> float | None:
+        """Seconds from detecting the last reconciled drift to the motor matching again."""
+        return self._last_converge_time
+
     def register_zone(self, zone) -> None:
         """Register a zone. Called by each DuctedHVACZone in async_added_to_hass."""
         self._zones.append(zone)
+        self._index.update(zone)
+        if self._startup_task is None:
+            self._async_check_startup()
+        else:
+            # Added after the startup batch was taken: start it on its own
+            self._hass.async_create_task(self._async_start_late_zone(zone))
+
+    def unregister_zone(self, zone) -> None:
+        """Forget a zone that is being removed.
+
+        Does not sync the motor, since zones are also removed when the entry
+        unloads; callers removing a single zone request the sync themselves.
+        """
+        if zone in self._zones:
+            self._zones.remove(zone)
+            self._index.remove(zone)
 
     def register_sensor(self, sensor) -> None:
         """Register the coordinator status sensor for push notifications."""
@@ -246,115 +686,506 @@ class MotorCoordinator:
     def async_fan_mode_changed(self, fan_mode: str) -> None:
         """Record the latest fan mode and schedule a motor sync."""
         self._last_fan_mode = fan_mode
-        self.async_zone_changed()
+        self.async_zone_changed(flush=True)
 
     @callback
-    def async_zone_changed(self) -> None:
-        """Schedule a debounced motor sync.
+    def async_zone_changed(self, *zones, flush: bool = False) -> None:
+        """Re-index the given zones and schedule a coalesced motor sync.
 
-        If a sync task is already pending (not yet started), skip scheduling a new one.
-        The pending task will pick up the latest zone state when it runs.
+        Zones must pass themselves whenever their vent, mode or setpoint
+        changes so the aggregate index stays current. Each call pushes the
+        sync back by the quiet window, capped so that the sync starts at most
+        max_delay after the first change of the burst.
+        Pass flush=True for user-initiated changes to sync immediately.
         """
-        if self._pending_sync is not None and not self._pending_sync.done():
+        for zone in zones:
+            if zone in self._zones:  # a removed zone's late vent outcome must not re-add it
+                self._index.update(zone)
+        if self._starting:
+            return  # the startup barrier syncs once every zone is in
+
+        now = self._hass.loop.time()
+        if self._burst_started is None:
+            self._burst_started = now
+
+        self._cancel_sync_timer()
+        delay = min(self._quiet_window, self._burst_started + self._max_delay - now)
+        if flush or delay <= 0:
+            self._async_start_sync()
+            return
+        self._unsub_sync_timer = async_call_later(self._hass, delay, self._async_sync_timer_fired)
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the motor entity's state."""
+        self._caller.on_change = self._notify_sensor
+        # When the motor's breaker half-opens, a sync pass is the probe
+        self._caller.breaker(self._motor_entity_id).on_probe = partial(
+            self.async_zone_changed, flush=True
+        )
+        self._refresh_capabilities(self._hass.states.get(self._motor_entity_id))
+        self._unsub_motor = async_track_state_change_event(
+            self._hass, [self._motor_entity_id], self._async_motor_state_changed
+        )
+        self._startup_began = self._hass.loop.time()
+        self._unsub_startup_timer = async_call_later(
+            self._hass, STARTUP_TIMEOUT, self._async_startup_timed_out
+        )
+        self._unsub_started = async_at_started(self._hass, self._async_hass_started)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any scheduled sync. Called when the config entry unloads."""
+        if self._unsub_motor is not None:
+            self._unsub_motor()
+            self._unsub_motor = None
+        for _, future in self._motor_waiters:
+            future.cancel()
+        self._motor_waiters.clear()
+        if self._limiter is not None:
+            self._limiter.async_shutdown()
+        self._cancel_sync_timer()
+        self._cancel_reconcile_timer()
+        self._cancel_confirm_timer()
+        self._cancel_startup_timer()
+        if self._unsub_started is not None:
+            self._unsub_started()
+            self._unsub_started = None
+        if self._startup_task is not None:
+            self._startup_task.cancel()
+        self._burst_started = None
+        self._sync_requested = False
+
+    @callback
+    def _async_hass_started(self, _hass) -> None:
+        self._unsub_started = None
+        self._hass_started = True
+        self._async_check_startup()
+
+    @callback
+    def _async_startup_timed_out(self, _now) -> None:
+        self._unsub_startup_timer = None
+        if len(self._zones) < self._expected_zones:
+            _LOGGER.warning(
+                "Only %d of %d zones registered within %ss, starting without the rest",
+                len(self._zones),
+                self._expected_zones,
+                STARTUP_TIMEOUT,
+            )
+        self._async_check_startup()
+
+    @callback
+    def _async_check_startup(self) -> None:
+        """Release the startup barrier once HA has started and all zones are in."""
+        if self._startup_task is not None or not self._hass_started:
+            return
+        if len(self._zones) < self._expected_zones and self._unsub_startup_timer is not None:
             return
-        self._pending_sync = self._hass.async_create_task(self._async_sync_motor())
+        self._cancel_startup_timer()
+        self._startup_task = self._hass.async_create_task(self._async_run_startup())
+
+    async def _async_run_startup(self) -> None:
+        """Evaluate every zone in one batch, then sync the motor once."""
+        zones = list(self._zones)
+        await self._async_start_zones(zones)
+        self._starting = False
+        if zones:
+            self.async_zone_changed(*zones, flush=True)
+
+    async def _async_start_late_zone(self, zone) -> None:
+        await self._async_start_zones([zone])
+        self.async_zone_changed(zone, flush=True)
+
+    async def _async_start_zones(self, zones: list) -> None:
+        """Run the zones' startup checks and wait for the resulting vent commands."""
+        await self._async_wait_vents(zone.async_startup_check() for zone in zones)
+
+    async def async_evaluate_zones(self, zones: list) -> None:
+        """Re-evaluate ``zones`` in one batch, wait for their vents, then sync once."""
+        await self._async_wait_vents(zone.async_recheck_vent() for zone in zones)
+        self.async_zone_changed(*zones, flush=True)
+
+    async def async_set_zones(
+        self,
+        zones: list,
+        hvac_mode: HVACMode | None,
+        temperature: float | None,
+        fan_mode: str | None,
+    ) -> None:
+        """Apply already validated values to ``zones`` and re-evaluate them as one batch.
+
+        Vent changes go out together and the motor is synced exactly once.
+        """
+        for zone in zones:
+            if hvac_mode is not None or temperature is not None:
+                zone.async_leave_preset()
+            zone.async_set_state(hvac_mode, temperature, fan_mode)
+        if fan_mode is not None:
+            self._last_fan_mode = fan_mode
+        await self.async_evaluate_zones(zones)
+
+    @staticmethod
+    async def _async_wait_vents(tasks) -> None:
+        if pending := [task for task in tasks if task is not None]:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _cancel_startup_timer(self) -> None:
+        if self._unsub_startup_timer is not None:
+            self._unsub_startup_timer()
+            self._unsub_startup_timer = None
+
+    @callback
+    def _async_sync_timer_fired(self, _now) -> None:
+        self._unsub_sync_timer = None
+        self._async_start_sync()
+
+    @callback
+    def _async_start_sync(self) -> None:
+        """Request a motor sync for the current burst of changes.
+
+        If a pass is already running it will see the flag and run once more.
+        """
+        if self._latency_origin is None:
+            self._latency_origin = self._burst_started or self._hass.loop.time()
+        self._burst_started = None
+        self._sync_requested = True
+        self._sync_wakeup.set()
+        if self._pending_sync is None or self._pending_sync.done():
+            self._pending_sync = self._hass.async_create_task(self._async_sync_loop())
+
+    async def _async_sync_loop(self) -> None:
+        """Run sync passes until no request arrived during the last one."""
+        while self._sync_requested:
+            self._sync_requested = False
+            self._sync_wakeup.clear()
+            origin, self._latency_origin = self._latency_origin, None
+            completed = await self._async_sync_motor()
+            if origin is not None:
+                if completed:
+                    now = self._hass.loop.time()
+                    self._last_sync_latency = round(now - origin, 3)
+                    if self._startup_began is not None:
+                        self._startup_duration = round(now - self._startup_began, 3)
+                        self._startup_began = None
+                elif self._latency_origin is None or origin < self._latency_origin:
+                    # Superseded while queued: measure the next pass from this origin
+                    self._latency_origin = origin
+            self._notify_sensor()
+        # No await follows, so a new request cannot slip in before the check
+        self._pending_sync = None
+        self._async_start_confirm_window()
+        self._async_check_drift(self._hass.states.get(self._motor_entity_id))
+
+    def _cancel_sync_timer(self) -> None:
+        if self._unsub_sync_timer is not None:
+            self._unsub_sync_timer()
+            self._unsub_sync_timer = None
+
+    async def _async_sync_motor(self) -> bool:
+        """Determine the correct motor state from all zones and apply it.
 
-    async def _async_sync_motor(self) -> None:
-        """Determine the correct motor state from all zones and apply it."""
+        Returns False if a newer sync request superseded this pass before its
+        rate-limited commands were sent.
+        """
         # Yield to let any in-flight async_write_ha_state calls complete
         await asyncio.sleep(0)
 
-        open_zones = [z for z in self._zones if z.vent_is_open]
+        index = self._index
 
-        if not open_zones:
+        if not index.open_count:
             # All vents closed — turn off the motor
             self._last_active_mode = None
             self._last_motor_temp = None
-            try:
-                await self._hass.services.async_call(
-                    "climate",
-                    "turn_off",
-                    {"entity_id": self._motor_entity_id},
-                    blocking=True,
-                )
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception("Failed to turn off motor %s", self._motor_entity_id)
-            self._notify_sensor()
-            return
+            return await self._async_apply_plan(None, None, None)
 
         # Determine the winning mode by priority
-        open_modes = {z.hvac_mode for z in open_zones}
         target_mode = next(
-            (m for m in MODE_PRIORITY if m in open_modes),
+            (m for m in MODE_PRIORITY if index.has_open_mode(m)),
             HVACMode.FAN_ONLY,
         )
 
         # Determine temperature setpoint from ALL active (non-OFF) zones in temp-controlled modes.
-        # We intentionally use self._zones (not open_zones) so the motor temperature reflects
+        # The index covers every zone (not just open ones) so the motor temperature reflects
         # all zone targets, not just zones whose vents happen to be open right now. A vent only
         # opens once the room deviates beyond the hysteresis tolerance, so if we only looked at
         # open zones the motor would never receive a setpoint when rooms are near their target.
-        all_active_temps = [
-            z.target_temperature
-            for z in self._zones
-            if z.target_temperature is not None and z.hvac_mode in TEMP_CONTROLLED_MODES
-        ]
-
         if target_mode == HVACMode.COOL:
-            target_temp = min(all_active_temps) if all_active_temps else None
+            target_temp = index.min_setpoint()
         elif target_mode == HVACMode.HEAT:
-            target_temp = max(all_active_temps) if all_active_temps else None
+            target_temp = index.max_setpoint()
         else:
             target_temp = None
 
+        if not self._capabilities.supports_mode(target_mode):
+            # A setpoint meant for this mode would be wrong for the motor's current one
+            if target_mode not in self._unsupported_modes:
+                self._unsupported_modes.add(target_mode)
+                _LOGGER.warning(
+                    "Motor %s does not support %s, leaving it unchanged",
+                    self._motor_entity_id,
+                    target_mode,
+                )
+            return True
+
+        if target_temp is not None:
+            target_temp = self._capabilities.normalize_temperature(target_temp)
+
         self._last_active_mode = target_mode.value
         self._last_motor_temp = target_temp
 
+        return await self._async_apply_plan(target_mode.value, target_temp, self._last_fan_mode)
+
+    async def _async_apply_plan(
+        self, hvac_mode: str | None, temperature: float | None, fan_mode: str | None
+    ) -> bool:
+        """Diff the desired state against the motor and send only what changed."""
+        self._desired = (hvac_mode, temperature, fan_mode)
+        current = self._hass.states.get(self._motor_entity_id)
+        if self._limiter is not None:
+            # Plan against the state queued commands will produce, so nothing is re-sent
+            current = self._limiter.expected(current)
+        plan = plan_motor_commands(
+            current, hvac_mode, temperature, fan_mode, self._capabilities
+        )
+        self._commands_skipped += plan.skipped
+
+        if self._limiter is not None:
+            return await self._async_dispatch_limited(plan.commands)
+        if self._dispatch == MOTOR_DISPATCH_PIPELINED:
+            await self._async_dispatch_pipelined(plan.commands)
+        else:
+            await self._async_dispatch_sequential(plan.commands)
+        return True
+
+    async def _async_dispatch_sequential(self, commands: list[MotorCommand]) -> None:
+        """Send each command in turn, waiting for the call to return."""
+        for command in commands:
+            if not await self._async_send(command) and command.sets_mode:
+                # The remaining commands assume the mode was applied
+                return
+
+    async def _async_dispatch_limited(self, commands: list[MotorCommand]) -> bool:
+        """Queue commands on the rate limiter and wait for them to be sent.
+
+        Returns False if a new sync request arrives first; its pass then merges
+        newer intents into the commands still waiting in the queue.
+        """
+        send = (
+            self._async_send_confirmed
+            if self._dispatch == MOTOR_DISPATCH_PIPELINED
+            else self._async_send
+        )
+        futures = [self._limiter.async_submit(c, partial(send, c)) for c in commands]
+        if not futures:
+            return True
+        sent = asyncio.gather(*futures)
+        wakeup = asyncio.ensure_future(self._sync_wakeup.wait())
         try:
-            await self._hass.services.async_call(
+            await asyncio.wait({sent, wakeup}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            wakeup.cancel()
+        return sent.done()
+
+    async def _async_send(self, command: MotorCommand) -> bool:
+        """Call ``command`` on the motor and wait for the call to return."""
+        try:
+            await self._caller.async_call(
+                "climate", command.service, [self._motor_entity_id], command.data
+            )
+        except CircuitOpenError:
+            _LOGGER.debug(
+                "Motor %s circuit is open, skipping %s", self._motor_entity_id, command.service
+            )
+            return False
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception(
+                "Failed to call %s on motor %s with %s",
+                command.service,
+                self._motor_entity_id,
+                command.data,
+            )
+            return False
+        self._commands_sent += 1
+        return True
+
+    async def _async_dispatch_pipelined(self, commands: list[MotorCommand]) -> None:
+        """Send the mode command, then the remaining commands concurrently."""
+        for command in (c for c in commands if c.sets_mode):
+            if not await self._async_send_confirmed(command):
+                # The remaining commands assume the mode was applied
+                return
+        await asyncio.gather(
+            *(self._async_send_confirmed(c) for c in commands if not c.sets_mode)
+        )
+
+    async def _async_send_confirmed(self, command: MotorCommand) -> bool:
+        """Send ``command`` without blocking and wait for the motor to reflect it."""
+        satisfied = command_satisfied_by(command)
+        if (state := self._hass.states.get(self._motor_entity_id)) is not None and satisfied(state):
+            # Planned against queued commands that were dropped, or the motor got
+            # there meanwhile; sending would produce no state change to confirm
+            self._commands_skipped += 1
+            return True
+        future: asyncio.Future = self._hass.loop.create_future()
+        waiter = (satisfied, future)
+        # Register before sending so a fast state change cannot be missed
+        self._motor_waiters.append(waiter)
+        try:
+            await self._caller.async_call(
                 "climate",
-                "set_hvac_mode",
-                {"entity_id": self._motor_entity_id, "hvac_mode": target_mode.value},
-                blocking=True,
+                command.service,
+                [self._motor_entity_id],
+                command.data,
+                blocking=False,
+            )
+            self._commands_sent += 1
+            await asyncio.wait_for(future, self._confirm_timeout)
+        except CircuitOpenError:
+            _LOGGER.debug(
+                "Motor %s circuit is open, skipping %s", self._motor_entity_id, command.service
             )
+            return False
+        except TimeoutError:
+            # The call went through; a motor that reports a rounded or stale state
+            # is not unreachable, so this is not held against its breaker
+            _LOGGER.warning(
+                "Motor %s did not confirm %s %s within %ss",
+                self._motor_entity_id,
+                command.service,
+                command.data,
+                self._confirm_timeout,
+            )
+            return False
         except Exception:  # noqa: BLE001
             _LOGGER.exception(
-                "Failed to set motor %s mode to %s", self._motor_entity_id, target_mode
+                "Failed to call %s on motor %s with %s",
+                command.service,
+                self._motor_entity_id,
+                command.data,
             )
+            return False
+        finally:
+            if waiter in self._motor_waiters:
+                self._motor_waiters.remove(waiter)
+        return True
+
+    @callback
+    def _async_motor_state_changed(self, event: Event) -> None:
+        """Refresh capabilities and resolve pending confirmations against the new state."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+        self._refresh_capabilities(new_state)
+        for predicate, future in self._motor_waiters:
+            if not future.done() and predicate(new_state):
+                future.set_result(None)
+        self._async_check_drift(new_state)
+
+    @callback
+    def _async_check_drift(self, state: State | None) -> None:
+        """Compare the motor's actual state with the desired one.
+
+        Drift schedules a reconciliation pass; a match ends the drift and
+        records how long it took to converge. Nothing is judged while a sync is
+        in progress, and a mismatch within the confirm window after a sync is
+        ignored, since the motor may not have reported our commands yet.
+        """
+        if self._reconcile_interval <= 0 or self._syncing:
+            return
+        if (drifted := self._is_drifted(state)) is None:
+            return
+
+        now = self._hass.loop.time()
+        if not drifted:
+            self._cancel_reconcile_timer()
+            if self._drift_started is not None:
+                if self._drift_reconciled:
+                    self._last_converge_time = round(now - self._drift_started, 3)
+                self._drift_started = None
+                self._drift_reconciled = False
+                self._notify_sensor()
+            return
+
+        if now < self._confirm_until:
+            return  # re-checked when the confirm window ends
+        if self._drift_started is None:
+            self._drift_started = now
             self._notify_sensor()
+        if self._unsub_reconcile_timer is None:
+            delay = max(self._drift_grace, self._last_reconcile + self._reconcile_interval - now)
+            self._unsub_reconcile_timer = async_call_later(
+                self._hass, delay, self._async_reconcile
+            )
+
+    @callback
+    def _async_start_confirm_window(self) -> None:
+        """Give the motor drift_grace to report the state a sync just sent."""
+        self._cancel_confirm_timer()
+        self._cancel_reconcile_timer()  # judged afresh once the window ends
+        self._confirm_until = self._hass.loop.time() + self._drift_grace
+        if self._reconcile_interval > 0:
+            self._unsub_confirm_timer = async_call_later(
+                self._hass, self._drift_grace, self._async_confirm_window_ended
+            )
+
+    @callback
+    def _async_confirm_window_ended(self, _now) -> None:
+        self._unsub_confirm_timer = None
+        self._async_check_drift(self._hass.states.get(self._motor_entity_id))
+
+    @callback
+    def _async_reconcile(self, _now) -> None:
+        """Re-sync the motor if it still disagrees with the desired state."""
+        self._unsub_reconcile_timer = None
+        state = self._hass.states.get(self._motor_entity_id)
+        if self._syncing:
+            return
+        if not self._is_drifted(state):
+            self._async_check_drift(state)
             return
+        if not self._drift_reconciled:
+            self._drift_reconciled = True
+            self._drift_count += 1
+            _LOGGER.info(
+                "Motor %s drifted from the desired state (%s), reconciling",
+                self._motor_entity_id,
+                state.state,
+            )
+        self._last_reconcile = self._hass.loop.time()
+        self._async_start_sync()
 
-        if target_temp is not None:
-            try:
-                await self._hass.services.async_call(
-                    "climate",
-                    "set_temperature",
-                    {"entity_id": self._motor_entity_id, "temperature": target_temp},
-                    blocking=True,
-                )
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception(
-                    "Failed to set motor %s temperature to %s",
-                    self._motor_entity_id,
-                    target_temp,
-                )
+    def _is_drifted(self, state: State | None) -> bool | None:
+        """Return whether ``state`` differs from the desired state, None if unknowable."""
+        if self._desired is None:
+            return None
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return None
+        return bool(plan_motor_commands(state, *self._desired, self._capabilities).commands)
 
-        if self._last_fan_mode is not None:
-            try:
-                await self._hass.services.async_call(
-                    "climate",
-                    "set_fan_mode",
-                    {"entity_id": self._motor_entity_id, "fan_mode": self._last_fan_mode},
-                    blocking=True,
-                )
-            except Exception:  # noqa: BLE001
-                _LOGGER.exception(
-                    "Failed to set motor %s fan mode to %s",
-                    self._motor_entity_id,
-                    self._last_fan_mode,
-                )
+    @property
+    def _syncing(self) -> bool:
+        return (
+            (self._pending_sync is not None and not self._pending_sync.done())
+            or bool(self._motor_waiters)
+            or self.motor_queue_depth > 0
+        )
+
+    def _cancel_reconcile_timer(self) -> None:
+        if self._unsub_reconcile_timer is not None:
+            self._unsub_reconcile_timer()
+            self._unsub_reconcile_timer = None
+
+    def _cancel_confirm_timer(self) -> None:
+        if self._unsub_confirm_timer is not None:
+            self._unsub_confirm_timer()
+            self._unsub_confirm_timer = None
 
-        self._notify_sensor()
+    def _refresh_capabilities(self, state: State | None) -> None:
+        capabilities = MotorCapabilities.from_state(state)
+        if capabilities is not None and capabilities != self._capabilities:
+            _LOGGER.debug("Motor %s capabilities: %s", self._motor_entity_id, capabilities)
+            self._capabilities = capabilities
+            self._unsupported_modes.clear()
 
     def _notify_sensor(self) -> None:
         """Push state update to the coordinator sensor if registered."""
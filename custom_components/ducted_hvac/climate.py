@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from functools import partial
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
-from homeassistant.components.climate.const import HVACAction, HVACMode
+from homeassistant.components.climate.const import PRESET_NONE, HVACAction, HVACMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_TEMPERATURE,
+    STATE_OFF,
+    STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.start import async_at_started
 from homeassistant.util import dt as dt_util
 
 from . import (
@@ -28,16 +32,30 @@ from . import (
     CONF_MIN_TEMP,
     CONF_MODES,
     CONF_SENSOR,
+    CONF_SENSOR_MIN_DELTA,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_PRECISION,
     CONF_TEMP_STEP,
     CONF_TOLERANCE,
     CONF_UNIQUE_ID,
     CONF_VENT,
+    CONF_VENT_ANTICIPATION,
     CONF_ZONES,
+    DEFAULT_SENSOR_MIN_DELTA,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_PRECISION,
+    DEFAULT_VENT_ANTICIPATION,
     DOMAIN,
     TEMP_CONTROLLED_MODES,
     MotorCoordinator,
     build_device_info,
 )
+from .ingest import SensorIngestFilter
+from .preset import PresetManager
+from .router import ZoneEventRouter
+from .thermal import ThermalRateLearner
+from .trend import TemperatureTrend, VentCycleStats
+from .vent import VentActuator
 from homeassistant.const import CONF_NAME
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,6 +64,13 @@ ATTR_VENT_OPEN = "vent_open"
 ATTR_VENT_ENTITY_ID = "vent_entity_id"
 ATTR_SENSOR_ENTITY_ID = "sensor_entity_id"
 ATTR_LAST_VENT_TOGGLE = "last_vent_toggle"
+ATTR_VENT_COMMANDS_COLLAPSED = "vent_commands_collapsed"
+ATTR_VENT_TOGGLES_PER_HOUR = "vent_toggles_per_hour"
+ATTR_OVERSHOOT = "overshoot"  # past the target in the last closed-vent cycle
+ATTR_OVERSHOOT_MEAN = "overshoot_mean"
+ATTR_HEATING_RATE = "heating_rate"  # learned °/min with the vent open
+ATTR_COOLING_RATE = "cooling_rate"
+ATTR_PRESET_SAVED = "preset_saved"  # zone's own mode and setpoint while a preset is active
 
 # HVACAction mapping per mode
 _MODE_ACTION_OPEN: dict[HVACMode, HVACAction] = {
@@ -61,9 +86,81 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up DuctedHVACZone entities from a config entry."""
+    """Set up DuctedHVACZone entities from a config entry.
+
+    Stores ``apply_zones`` and ``apply_settings`` callbacks in the entry's
+    domain data so options-flow edits can be applied without a reload.
+    """
+    domain_data = hass.data[DOMAIN][entry.entry_id]
+    entities = {
+        zone_cfg["unique_id"]: _build_zone(hass, entry, zone_cfg)
+        for zone_cfg in entry.data["zones"]
+    }
+    domain_data["apply_zones"] = partial(
+        _async_apply_zones, hass, entry, async_add_entities, entities
+    )
+    domain_data["apply_settings"] = partial(_async_apply_settings, hass, entry, entities)
+    async_add_entities(entities.values())
+
+
+async def _async_apply_settings(
+    hass: HomeAssistant, entry: ConfigEntry, entities: dict[str, DuctedHVACZone]
+) -> None:
+    """Push edited global settings to every zone and re-evaluate them together."""
+    domain_data = hass.data[DOMAIN][entry.entry_id]
+    cfg = entry.data
+    mcd_seconds = cfg.get("min_cycle_duration") or 0
+    for entity in entities.values():
+        entity.async_update_settings(
+            domain_data["modes"],
+            domain_data.get("fan_modes") or [],
+            cfg["min_temp"],
+            cfg["max_temp"],
+            cfg["temp_step"],
+            cfg["tolerance"],
+            timedelta(seconds=mcd_seconds) if mcd_seconds else None,
+        )
+    await domain_data["coordinator"].async_evaluate_zones(list(entities.values()))
+
+
+async def _async_apply_zones(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entities: dict[str, DuctedHVACZone],
+    zones: list[dict],
+) -> None:
+    """Add, remove and re-point zone entities to match ``zones``."""
+    wanted = {zone_cfg["unique_id"]: zone_cfg for zone_cfg in zones}
+    registry = er.async_get(hass)
+
+    removed = [entities.pop(uid) for uid in list(entities) if uid not in wanted]
+    for entity in removed:
+        _LOGGER.debug("Removing zone %s", entity.name)
+        await entity.async_remove(force_remove=True)
+        if registry.async_get(entity.entity_id) is not None:
+            registry.async_remove(entity.entity_id)
+    if removed:
+        hass.data[DOMAIN][entry.entry_id]["coordinator"].async_zone_changed(flush=True)
+
+    added = []
+    for uid, zone_cfg in wanted.items():
+        if (entity := entities.get(uid)) is None:
+            entity = entities[uid] = _build_zone(hass, entry, zone_cfg)
+            added.append(entity)
+        else:
+            entity.async_update_zone(
+                zone_cfg[CONF_NAME], zone_cfg[CONF_VENT], zone_cfg[CONF_SENSOR]
+            )
+    if added:
+        async_add_entities(added)
+
+
+def _build_zone(hass: HomeAssistant, entry: ConfigEntry, zone_cfg: dict) -> DuctedHVACZone:
     domain_data = hass.data[DOMAIN][entry.entry_id]
     coordinator: MotorCoordinator = domain_data["coordinator"]
+    router: ZoneEventRouter = domain_data["router"]
+    actuator: VentActuator = domain_data["actuator"]
     cfg = entry.data
     modes: list[HVACMode] = domain_data["modes"]
 
@@ -74,29 +171,35 @@ async def async_setup_entry(
     mcd_seconds = cfg.get("min_cycle_duration") or 0
     min_cycle_duration = timedelta(seconds=mcd_seconds) if mcd_seconds else None
     fan_modes: list[str] = domain_data.get("fan_modes") or []
-    device_info = build_device_info(entry)
-
-    entities = []
-    for zone_cfg in cfg["zones"]:
-        entity = DuctedHVACZone(
-            hass=hass,
-            name=zone_cfg[CONF_NAME],
-            unique_id=zone_cfg["unique_id"],
-            vent_entity_id=zone_cfg[CONF_VENT],
-            sensor_entity_id=zone_cfg[CONF_SENSOR],
-            coordinator=coordinator,
-            modes=modes,
-            fan_modes=fan_modes,
-            min_temp=min_temp,
-            max_temp=max_temp,
-            temp_step=temp_step,
-            tolerance=tolerance,
-            min_cycle_duration=min_cycle_duration,
-            device_info=device_info,
-        )
-        entities.append(entity)
-
-    async_add_entities(entities)
+    sensor_precision: float = cfg.get(CONF_SENSOR_PRECISION, DEFAULT_SENSOR_PRECISION)
+    sensor_min_delta: float = cfg.get(CONF_SENSOR_MIN_DELTA, DEFAULT_SENSOR_MIN_DELTA)
+    sensor_min_interval: float = cfg.get(CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL)
+    anticipation: float = cfg.get(CONF_VENT_ANTICIPATION, DEFAULT_VENT_ANTICIPATION)
+
+    return DuctedHVACZone(
+        hass=hass,
+        name=zone_cfg[CONF_NAME],
+        unique_id=zone_cfg["unique_id"],
+        vent_entity_id=zone_cfg[CONF_VENT],
+        sensor_entity_id=zone_cfg[CONF_SENSOR],
+        coordinator=coordinator,
+        router=router,
+        actuator=actuator,
+        presets=domain_data["presets"],
+        thermal=domain_data["thermal"],
+        modes=modes,
+        fan_modes=fan_modes,
+        min_temp=min_temp,
+        max_temp=max_temp,
+        temp_step=temp_step,
+        tolerance=tolerance,
+        min_cycle_duration=min_cycle_duration,
+        sensor_precision=sensor_precision,
+        sensor_min_delta=sensor_min_delta,
+        sensor_min_interval=sensor_min_interval,
+        anticipation=anticipation,
+        device_info=build_device_info(entry),
+    )
 
 
 async def async_setup_platform(
@@ -145,7 +248,9 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
     """A single zone climate entity for a ducted HVAC system.
 
     Controls one vent switch based on temperature and mode, and notifies
-    a MotorCoordinator whenever the vent state changes.
+    a MotorCoordinator whenever the vent state changes. The switch's reported
+    state is authoritative: it overrides the restored state at startup, and
+    changes made outside the integration are adopted as they happen.
     """
 
     _attr_should_poll = False
@@ -159,6 +264,10 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         vent_entity_id: str,
         sensor_entity_id: str,
         coordinator: MotorCoordinator,
+        router: ZoneEventRouter,
+        actuator: VentActuator,
+        presets: PresetManager,
+        thermal: ThermalRateLearner,
         modes: list[HVACMode],
         fan_modes: list[str],
         min_temp: float,
@@ -166,6 +275,10 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         temp_step: float,
         tolerance: float,
         min_cycle_duration: timedelta | None,
+        sensor_precision: float = DEFAULT_SENSOR_PRECISION,
+        sensor_min_delta: float = DEFAULT_SENSOR_MIN_DELTA,
+        sensor_min_interval: float = DEFAULT_SENSOR_MIN_INTERVAL,
+        anticipation: float = DEFAULT_VENT_ANTICIPATION,
         device_info: DeviceInfo | None = None,
     ) -> None:
         self.hass = hass
@@ -174,18 +287,53 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         self._vent_entity_id = vent_entity_id
         self._sensor_entity_id = sensor_entity_id
         self._coordinator = coordinator
+        self._router = router
+        self._actuator = actuator
+        self._presets = presets
+        self._thermal = thermal
         self._tolerance = tolerance
         self._min_cycle_duration = min_cycle_duration
+        self._ingest = SensorIngestFilter(
+            hass,
+            self._async_temperature_received,
+            precision=sensor_precision,
+            min_delta=sensor_min_delta,
+            min_interval=sensor_min_interval,
+        )
+        self._anticipation = anticipation  # seconds to project ahead; 0 = plain hysteresis
+        self._trend = TemperatureTrend()
+        self._cycle_stats = VentCycleStats()
 
         if device_info is not None:
             self._attr_device_info = device_info
 
         # ClimateEntity attributes
-        self._attr_hvac_modes = modes
         self._attr_min_temp = min_temp
         self._attr_max_temp = max_temp
         self._attr_target_temperature_step = temp_step
         self._attr_temperature_unit = hass.config.units.temperature_unit
+        self._fan_mode: str | None = None
+        self._set_modes(modes, fan_modes)
+
+        # Internal state
+        self._hvac_mode: HVACMode = HVACMode.OFF
+        self._target_temp: float = (min_temp + max_temp) / 2
+        self._current_temp: float | None = None
+        self._vent_open: bool = False
+        self._last_vent_toggle: datetime | None = None
+
+        # Vent actuation mailbox: at most one command in flight, latest intent wins
+        self._vent_worker: asyncio.Task | None = None
+        self._vent_in_flight: bool | None = None  # state being commanded right now
+        self._vent_intent: bool | None = None  # next state to command, if any
+        self._vent_collapsed = 0
+
+        # Listener unsubscribe handles
+        self._unsub_cycle_timer = None  # re-evaluation once min_cycle_duration expires
+
+    def _set_modes(self, modes: list[HVACMode], fan_modes: list[str]) -> None:
+        """Set the available modes and fan modes and the features they imply."""
+        self._attr_hvac_modes = modes
 
         # Only advertise TARGET_TEMPERATURE if at least one temp-controlled mode is present
         has_temp_mode = any(m in TEMP_CONTROLLED_MODES for m in modes)
@@ -193,26 +341,20 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         if has_temp_mode:
             self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
 
+        # Presets are entry-wide; offered only when the entry defines some
+        if self._presets.preset_modes:
+            self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
+
         # Fan mode support (optional — empty list disables the feature)
         if fan_modes:
             self._attr_fan_modes = fan_modes
             self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
-            self._fan_mode: str | None = fan_modes[0]
+            if self._fan_mode not in fan_modes:
+                self._fan_mode = fan_modes[0]
         else:
             self._attr_fan_modes = []
             self._fan_mode = None
 
-        # Internal state
-        self._hvac_mode: HVACMode = HVACMode.OFF
-        self._target_temp: float = (min_temp + max_temp) / 2
-        self._current_temp: float | None = None
-        self._vent_open: bool = False
-        self._last_vent_toggle: datetime | None = None
-
-        # Listener unsubscribe handles
-        self._unsub_sensor = None
-        self._unsub_startup = None
-
     # ------------------------------------------------------------------
     # ClimateEntity properties
     # ------------------------------------------------------------------
@@ -241,8 +383,21 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
     def fan_mode(self) -> str | None:
         return self._fan_mode
 
+    @property
+    def preset_mode(self) -> str | None:
+        if not self._presets.preset_modes:
+            return None
+        if not self._presets.is_active_for(self.unique_id):
+            return PRESET_NONE  # left the preset through a manual change
+        return self._presets.active
+
+    @property
+    def preset_modes(self) -> list[str] | None:
+        return self._presets.preset_modes or None
+
     @property
     def extra_state_attributes(self) -> dict:
+        saved = self._presets.saved(self.unique_id)
         return {
             ATTR_VENT_OPEN: self._vent_open,
             ATTR_VENT_ENTITY_ID: self._vent_entity_id,
@@ -250,6 +405,15 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
             ATTR_LAST_VENT_TOGGLE: (
                 self._last_vent_toggle.isoformat() if self._last_vent_toggle else None
             ),
+            ATTR_VENT_COMMANDS_COLLAPSED: self._vent_collapsed,
+            ATTR_VENT_TOGGLES_PER_HOUR: self._cycle_stats.toggles_per_hour(self.hass.loop.time()),
+            ATTR_OVERSHOOT: self._cycle_stats.last_overshoot,
+            ATTR_OVERSHOOT_MEAN: self._cycle_stats.mean_overshoot,
+            ATTR_HEATING_RATE: self._thermal.rate(self.unique_id, HVACMode.HEAT),
+            ATTR_COOLING_RATE: self._thermal.rate(self.unique_id, HVACMode.COOL),
+            ATTR_PRESET_SAVED: (
+                {"hvac_mode": saved[0], ATTR_TEMPERATURE: saved[1]} if saved else None
+            ),
         }
 
     # ------------------------------------------------------------------
@@ -261,6 +425,16 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         """Return True if the vent is currently open (in-memory state)."""
         return self._vent_open
 
+    @property
+    def vent_entity_id(self) -> str:
+        """Entity ID of the vent switch controlled by this zone."""
+        return self._vent_entity_id
+
+    @property
+    def sensor_entity_id(self) -> str:
+        """Entity ID of the temperature sensor routed to this zone."""
+        return self._sensor_entity_id
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -295,33 +469,101 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
                 if (fm := attrs.get("fan_mode")) and fm in (self._attr_fan_modes or []):
                     self._fan_mode = fm
 
+            preset = attrs.get("preset_mode")
+            if preset not in (None, PRESET_NONE) and (saved := attrs.get(ATTR_PRESET_SAVED)):
+                try:
+                    self._presets.async_restore(
+                        self.unique_id,
+                        preset,
+                        (HVACMode(saved["hvac_mode"]), float(saved[ATTR_TEMPERATURE])),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    pass
+
+        # The real switch wins over the restored attribute when it has a state
+        if self._adopt_vent_state(self.hass.states.get(self._vent_entity_id)):
+            _LOGGER.debug("%s: vent restored as %s from the switch", self.name, self._vent_open)
+
         # 2. Read current sensor value
         self._update_current_temp()
 
-        # 3. Register with coordinator
+        # 3. Register with coordinator; it runs async_startup_check once HA has
+        #    started and every zone of the entry is registered
         self._coordinator.register_zone(self)
 
-        # 4. Subscribe to sensor state changes
-        self._unsub_sensor = async_track_state_change_event(
-            self.hass,
-            [self._sensor_entity_id],
-            self._async_sensor_changed,
-        )
-
-        # 5. Defer initial vent evaluation until HA is fully started
-        self._unsub_startup = async_at_started(self.hass, self._async_startup_check)
+        # 4. Route sensor and vent state changes through the entry-level router
+        self._router.async_register(self)
 
-        # 6. Write initial state
+        # 5. Write initial state
         self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe all listeners."""
-        if self._unsub_sensor:
-            self._unsub_sensor()
-            self._unsub_sensor = None
-        if self._unsub_startup:
-            self._unsub_startup()
-            self._unsub_startup = None
+        """Unsubscribe all listeners and leave the coordinator."""
+        self._router.async_unregister(self)
+        self._coordinator.unregister_zone(self)
+        self._actuator.async_forget(self)
+        self._ingest.async_cancel()
+        self._vent_intent = None
+        if self._vent_worker is not None and not self._vent_worker.done():
+            self._vent_worker.cancel()
+        if self._unsub_cycle_timer:
+            self._unsub_cycle_timer()
+            self._unsub_cycle_timer = None
+
+    @callback
+    def async_update_zone(self, name: str, vent_entity_id: str, sensor_entity_id: str) -> None:
+        """Apply an edited zone configuration in place."""
+        old_vent, old_sensor = self._vent_entity_id, self._sensor_entity_id
+        self._attr_name = name
+        if (vent_entity_id, sensor_entity_id) != (old_vent, old_sensor):
+            _LOGGER.debug(
+                "%s: re-pointing to vent %s and sensor %s", name, vent_entity_id, sensor_entity_id
+            )
+            self._vent_entity_id = vent_entity_id
+            self._sensor_entity_id = sensor_entity_id
+            self._router.async_repoint(self, old_sensor, old_vent)
+            if sensor_entity_id != old_sensor:
+                self._ingest.async_cancel()
+                self._trend.clear()
+                self._current_temp = None
+                self._update_current_temp()
+            if vent_entity_id != old_vent:
+                self._actuator.async_forget(self, old_vent)
+                self._adopt_vent_state(self.hass.states.get(vent_entity_id))
+                self._coordinator.async_zone_changed(self)
+            self._async_evaluate_vent()
+        self.async_write_ha_state()
+
+    @callback
+    def async_update_settings(
+        self,
+        modes: list[HVACMode],
+        fan_modes: list[str],
+        min_temp: float,
+        max_temp: float,
+        temp_step: float,
+        tolerance: float,
+        min_cycle_duration: timedelta | None,
+    ) -> None:
+        """Apply edited global settings in place.
+
+        The caller re-evaluates the vent, normally for all zones in one batch.
+        """
+        self._set_modes(modes, fan_modes)
+        if self._hvac_mode not in modes:
+            self._hvac_mode = HVACMode.OFF
+        self._attr_min_temp = min_temp
+        self._attr_max_temp = max_temp
+        self._attr_target_temperature_step = temp_step
+        self._target_temp = min(max(self._target_temp, min_temp), max_temp)
+        self._tolerance = tolerance
+        if min_cycle_duration != self._min_cycle_duration:
+            self._min_cycle_duration = min_cycle_duration
+            # A pending re-check was timed for the old duration
+            if self._unsub_cycle_timer is not None:
+                self._unsub_cycle_timer()
+                self._unsub_cycle_timer = None
+        self.async_write_ha_state()
 
     # ------------------------------------------------------------------
     # Service handlers
@@ -337,23 +579,62 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
                 self._attr_hvac_modes,
             )
             return
+        self.async_leave_preset()
         self._hvac_mode = hvac_mode
         self.async_write_ha_state()
         await self._async_control_vent()
-        self._coordinator.async_zone_changed()
+        self._coordinator.async_zone_changed(self, flush=True)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set target temperature and re-evaluate vent."""
         if (temp := kwargs.get(ATTR_TEMPERATURE)) is not None:
+            self.async_leave_preset()
             self._target_temp = float(temp)
             self.async_write_ha_state()
             await self._async_control_vent()
-            self._coordinator.async_zone_changed()
+            self._coordinator.async_zone_changed(self, flush=True)
 
         # Handle combined hvac_mode + temperature calls
         if hvac_mode := kwargs.get("hvac_mode"):
             await self.async_set_hvac_mode(HVACMode(hvac_mode))
 
+    @callback
+    def async_set_state(
+        self,
+        hvac_mode: HVACMode | None = None,
+        temperature: float | None = None,
+        fan_mode: str | None = None,
+    ) -> None:
+        """Apply mode, setpoint and fan speed without evaluating the vent.
+
+        Used by the set_zones service, which validates the values first and
+        re-evaluates all targeted zones in one batch.
+        """
+        if hvac_mode is not None:
+            self._hvac_mode = hvac_mode
+        if temperature is not None:
+            self._target_temp = min(max(temperature, self._attr_min_temp), self._attr_max_temp)
+        if fan_mode is not None:
+            self._fan_mode = fan_mode
+        self.async_write_ha_state()
+
+    @callback
+    def async_leave_preset(self) -> None:
+        """Take this zone out of the active preset; called on manual mode/setpoint changes."""
+        self._presets.async_leave(self.unique_id)
+
+    async def async_set_preset_mode(self, preset_mode: str) -> None:
+        """Switch the whole system to ``preset_mode`` in one batch."""
+        if preset_mode not in self._presets.preset_modes:
+            _LOGGER.warning(
+                "%s: preset %s not in configured presets %s",
+                self.name,
+                preset_mode,
+                self._presets.preset_modes,
+            )
+            return
+        await self._presets.async_activate(preset_mode)
+
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode and notify the coordinator (last-set wins)."""
         if fan_mode not in (self._attr_fan_modes or []):
@@ -398,7 +679,7 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         ):
             return
         try:
-            self._current_temp = float(sensor_state.state)
+            self._current_temp = self._ingest.quantize(float(sensor_state.state))
         except (TypeError, ValueError):
             _LOGGER.warning(
                 "%s: could not parse sensor %s state: %s",
@@ -408,31 +689,80 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
             )
 
     @callback
-    def _async_sensor_changed(self, event) -> None:
-        """Handle temperature sensor state change."""
+    def async_sensor_changed(self, event) -> None:
+        """Handle temperature sensor state change. Called by ZoneEventRouter."""
         new_state = event.data.get("new_state")
         if new_state is None or new_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
             return
+        old_state = event.data.get("old_state")
+        if old_state is not None and old_state.state == new_state.state:
+            return  # attribute-only update
         try:
-            self._current_temp = float(new_state.state)
+            value = float(new_state.state)
         except (TypeError, ValueError):
             return
 
+        self._ingest.async_ingest(value, self._current_temp)
+
+    @callback
+    def async_vent_state_changed(self, event) -> None:
+        """Adopt a vent switch change made outside the integration. Called by ZoneEventRouter."""
+        if self._vent_in_flight is not None or self._vent_intent is not None:
+            return  # our own command; the actuator records its outcome
+        if not self._adopt_vent_state(event.data.get("new_state")):
+            return
+        self._record_vent_toggle()
+        _LOGGER.info(
+            "%s: vent %s was %s externally",
+            self.name,
+            self._vent_entity_id,
+            "opened" if self._vent_open else "closed",
+        )
         self.async_write_ha_state()
-        self.hass.async_create_task(self._async_control_vent())
+        self._coordinator.async_zone_changed(self)
+        self._async_evaluate_vent()
+
+    def _adopt_vent_state(self, state: State | None) -> bool:
+        """Take the switch's reported state as the vent state; return True if it changed."""
+        if state is None or state.state not in (STATE_ON, STATE_OFF):
+            return False
+        is_open = state.state == STATE_ON
+        if is_open == self._vent_open:
+            return False
+        self._vent_open = is_open
+        return True
 
     @callback
-    def _async_startup_check(self, _event=None) -> None:
-        """Run initial vent evaluation after HA has fully started."""
-        self._unsub_startup = None
+    def _async_temperature_received(self, value: float) -> None:
+        """Apply a reading that passed the ingest filter."""
+        self._current_temp = value
+        self._thermal.async_observe(self.unique_id, self._hvac_mode, self._vent_open, value)
+        self._trend.add(self.hass.loop.time(), value)
+        if not self._vent_open:
+            self._cycle_stats.observe(self._hvac_mode, value, self._target_temp)
+        self.async_write_ha_state()
+        self._async_evaluate_vent()
+
+    @callback
+    def async_startup_check(self) -> asyncio.Task | None:
+        """Run the initial vent evaluation. Called by MotorCoordinator after startup.
+
+        Returns the vent worker task if a toggle was requested; the coordinator
+        re-indexes the zone and syncs the motor once all zones are done.
+        """
         self._update_current_temp()
-        self.hass.async_create_task(self._async_control_vent())
+        # The switch may only have reported after this zone was added
+        self._adopt_vent_state(self.hass.states.get(self._vent_entity_id))
+        self.async_write_ha_state()
+        return self._async_evaluate_vent()
 
     def _should_vent_be_open(self) -> bool:
         """Determine desired vent state from current mode and temperature.
 
         Uses hysteresis: within the dead-band (target ± tolerance), the current
-        vent state is preserved to avoid unnecessary toggling.
+        vent state is preserved to avoid unnecessary toggling. With anticipation
+        enabled, an open vent inside the dead-band closes as soon as the
+        projected temperature crosses the target.
         """
         mode = self._hvac_mode
 
@@ -450,23 +780,50 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
 
         target = self._target_temp
         tol = self._tolerance
+        # Hold what was last commanded, not the last confirmed switch state, so a
+        # reading arriving while a toggle is queued or in flight doesn't undo it
+        commanded = self._commanded_vent_state()
 
         if mode == HVACMode.HEAT:
             if temp < target - tol:
                 return True   # too cold, need heating
             if temp >= target + tol:
                 return False  # warm enough, stop
-            return self._vent_open  # dead-band: no change
+            if commanded and self._projected_past_target(mode, target):
+                return False  # still rising after the vent closes; stop early
+            return commanded  # dead-band: no change
 
         if mode == HVACMode.COOL:
             if temp > target + tol:
                 return True   # too hot, need cooling
             if temp <= target - tol:
                 return False  # cool enough, stop
-            return self._vent_open  # dead-band: no change
+            if commanded and self._projected_past_target(mode, target):
+                return False  # still falling after the vent closes; stop early
+            return commanded  # dead-band: no change
 
         return False
 
+    def _projected_past_target(self, mode: HVACMode, target: float) -> bool:
+        """Return True if the zone is projected to reach ``target`` within the lag."""
+        if not self._anticipation:
+            return False
+        projected = self._trend.project(self.hass.loop.time(), self._anticipation)
+        if projected is None:
+            return False
+        return projected >= target if mode == HVACMode.HEAT else projected <= target
+
+    def _record_vent_toggle(self) -> None:
+        """Restart the trend and close or open an overshoot cycle."""
+        self._trend.clear()  # readings from the other vent state would skew the rate
+        self._cycle_stats.record_toggle(
+            self.hass.loop.time(),
+            self._vent_open,
+            self._hvac_mode,
+            self._current_temp,
+            self._target_temp,
+        )
+
     def _is_min_cycle_respected(self, desired_open: bool) -> bool:
         """Return True if the min_cycle_duration has elapsed since last toggle."""
         if self._min_cycle_duration is None:
@@ -476,39 +833,108 @@ class DuctedHVACZone(ClimateEntity, RestoreEntity):
         elapsed = dt_util.utcnow() - self._last_vent_toggle
         return elapsed >= self._min_cycle_duration
 
-    async def _async_control_vent(self) -> None:
-        """Evaluate vent state and toggle the switch if needed."""
+    def _schedule_cycle_recheck(self) -> None:
+        """Re-evaluate the vent once min_cycle_duration expires.
+
+        At most one timer is pending per zone; if one is already scheduled it
+        already fires at the right moment, since the last toggle has not moved.
+        """
+        if self._unsub_cycle_timer is not None:
+            return
+        remaining = self._last_vent_toggle + self._min_cycle_duration - dt_util.utcnow()
+        self._unsub_cycle_timer = async_call_later(
+            self.hass, max(remaining.total_seconds(), 0), self._async_cycle_expired
+        )
+
+    @callback
+    def _async_cycle_expired(self, _now) -> None:
+        self._unsub_cycle_timer = None
+        self._async_evaluate_vent()
+
+    @callback
+    def _async_evaluate_vent(self) -> asyncio.Task | None:
+        """Decide the vent state inline and request a toggle only if one is needed.
+
+        Most evaluations end in "no change" and return None without allocating
+        anything. Otherwise the command goes to the zone's vent mailbox and the
+        returned worker task finishes once the mailbox has drained.
+        """
         desired = self._should_vent_be_open()
 
-        if desired == self._vent_open:
-            return  # already in the right state
+        if desired == self._commanded_vent_state():
+            return None  # already in (or heading to) the right state
 
         if not self._is_min_cycle_respected(desired):
             _LOGGER.debug(
-                "%s: min_cycle_duration not yet elapsed, skipping vent toggle",
+                "%s: min_cycle_duration not yet elapsed, deferring vent toggle",
                 self.name,
             )
-            return
+            self._schedule_cycle_recheck()
+            return None
 
-        await self._async_set_vent(desired)
+        return self._async_request_vent(desired)
 
-    async def _async_set_vent(self, open: bool) -> None:  # noqa: A002
-        """Open or close the vent switch."""
-        service = "turn_on" if open else "turn_off"
-        try:
-            await self.hass.services.async_call(
-                "switch",
-                service,
-                {"entity_id": self._vent_entity_id},
-                blocking=True,
-            )
-        except Exception:  # noqa: BLE001
-            _LOGGER.exception(
-                "%s: failed to %s vent %s", self.name, service, self._vent_entity_id
-            )
-            return
+    def _commanded_vent_state(self) -> bool:
+        """Vent state the zone will end up in once queued commands complete."""
+        if self._vent_intent is not None:
+            return self._vent_intent
+        if self._vent_in_flight is not None:
+            return self._vent_in_flight
+        return self._vent_open
 
+    @callback
+    def _async_request_vent(self, open: bool) -> asyncio.Task:  # noqa: A002
+        """Post ``open`` to the vent mailbox, starting the worker if idle.
+
+        While a command is in flight only the latest intent is kept; any
+        intent it replaces is counted as collapsed.
+        """
+        if self._vent_worker is not None and not self._vent_worker.done():
+            if self._vent_intent is not None:
+                self._vent_collapsed += 1
+            self._vent_intent = open
+            return self._vent_worker
+        self._vent_intent = open
+        self._vent_worker = self.hass.async_create_task(self._async_vent_worker())
+        return self._vent_worker
+
+    async def _async_vent_worker(self) -> None:
+        """Send mailbox intents one at a time through the VentActuator.
+
+        The actuator batches each command with other zones', calls
+        async_vent_applied on success and notifies the coordinator.
+        """
+        while (intent := self._vent_intent) is not None:
+            self._vent_intent = None
+            if intent == self._vent_open:
+                self._vent_collapsed += 1  # superseded back to the current state
+                continue
+            if not self._is_min_cycle_respected(intent):
+                self._schedule_cycle_recheck()
+                continue
+            self._vent_in_flight = intent
+            try:
+                await self._actuator.async_request(self, intent)
+            finally:
+                self._vent_in_flight = None
+
+    async def _async_control_vent(self) -> None:
+        """Evaluate vent state and wait for any resulting toggle to finish."""
+        if (pending := self._async_evaluate_vent()) is not None:
+            await pending
+
+    @callback
+    def async_recheck_vent(self) -> asyncio.Task | None:
+        """Re-evaluate the vent, e.g. when its circuit breaker allows a probe.
+
+        Returns the vent worker task if a toggle was requested.
+        """
+        return self._async_evaluate_vent()
+
+    @callback
+    def async_vent_applied(self, open: bool) -> None:  # noqa: A002
+        """Record a vent command that the switch accepted. Called by VentActuator."""
         self._vent_open = open
         self._last_vent_toggle = dt_util.utcnow()
+        self._record_vent_toggle()
         self.async_write_ha_state()
-        self._coordinator.async_zone_changed()
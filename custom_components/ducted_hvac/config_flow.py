@@ -16,6 +16,7 @@ from homeassistant.helpers.selector import (
     NumberSelector,
     NumberSelectorConfig,
     NumberSelectorMode,
+    ObjectSelector,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -25,26 +26,71 @@ from homeassistant.helpers.selector import (
 )
 
 from . import (
+    CONF_BREAKER_RESET,
+    CONF_BREAKER_THRESHOLD,
+    CONF_CALL_RETRIES,
+    CONF_CALL_TIMEOUT,
+    CONF_DRIFT_GRACE,
+    CONF_DRIFT_RECONCILE_INTERVAL,
     CONF_FAN_MODES,
     CONF_MAX_TEMP,
     CONF_MIN_CYCLE_DURATION,
     CONF_MIN_TEMP,
     CONF_MODES,
     CONF_MOTOR,
+    CONF_MOTOR_COMMAND_BURST,
+    CONF_MOTOR_COMMAND_INTERVAL,
+    CONF_MOTOR_CONFIRM_TIMEOUT,
+    CONF_MOTOR_DISPATCH,
     CONF_NAME,
+    CONF_OPTIMAL_START_MAX,
+    CONF_PRESETS,
+    CONF_SCHEDULES,
     CONF_SENSOR,
+    CONF_SENSOR_MIN_DELTA,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_PRECISION,
+    CONF_SYNC_MAX_DELAY,
+    CONF_SYNC_QUIET_WINDOW,
     CONF_TEMP_STEP,
     CONF_TOLERANCE,
     CONF_VENT,
+    CONF_VENT_ANTICIPATION,
+    CONF_VENT_BATCH_WINDOW,
+    CONF_VENT_COMMAND_SPACING,
+    CONF_VENT_MAX_IN_FLIGHT,
     CONF_ZONES,
+    DEFAULT_BREAKER_RESET,
+    DEFAULT_BREAKER_THRESHOLD,
+    DEFAULT_CALL_RETRIES,
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_DRIFT_GRACE,
+    DEFAULT_DRIFT_RECONCILE_INTERVAL,
     DEFAULT_FAN_MODES,
     DEFAULT_MAX_TEMP,
     DEFAULT_MIN_TEMP,
+    DEFAULT_MOTOR_COMMAND_BURST,
+    DEFAULT_MOTOR_COMMAND_INTERVAL,
+    DEFAULT_MOTOR_CONFIRM_TIMEOUT,
+    DEFAULT_MOTOR_DISPATCH,
+    DEFAULT_OPTIMAL_START_MAX,
+    DEFAULT_SENSOR_MIN_DELTA,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_PRECISION,
+    DEFAULT_SYNC_MAX_DELAY,
+    DEFAULT_SYNC_QUIET_WINDOW,
     DEFAULT_TEMP_STEP,
     DEFAULT_TOLERANCE,
+    DEFAULT_VENT_ANTICIPATION,
+    DEFAULT_VENT_BATCH_WINDOW,
+    DEFAULT_VENT_COMMAND_SPACING,
+    DEFAULT_VENT_MAX_IN_FLIGHT,
     DOMAIN,
+    MOTOR_DISPATCH_MODES,
     VALID_MODES,
 )
+from .preset import validate_presets
+from .schedule import validate_schedules
 
 # String value of "off" excluded from mode picker (it's always included implicitly)
 _SELECTABLE_MODES = [m.value for m in VALID_MODES if m != HVACMode.OFF]
@@ -55,6 +101,11 @@ _MODE_LABELS = {
     "dry": "Dry",
 }
 
+_MOTOR_DISPATCH_LABELS = {
+    "sequential": "Sequential (wait for each command)",
+    "pipelined": "Pipelined (confirm by motor state)",
+}
+
 _SELECTABLE_FAN_MODES = ["auto", "low", "medium", "high", "turbo"]
 _FAN_MODE_LABELS = {
     "auto": "Auto",
@@ -147,6 +198,171 @@ def _global_schema(defaults: dict[str, Any]) -> vol.Schema:
     )
 
 
+def _advanced_schema(defaults: dict[str, Any]) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_SYNC_QUIET_WINDOW,
+                default=defaults.get(CONF_SYNC_QUIET_WINDOW, DEFAULT_SYNC_QUIET_WINDOW),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=10, step=0.05, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_SYNC_MAX_DELAY,
+                default=defaults.get(CONF_SYNC_MAX_DELAY, DEFAULT_SYNC_MAX_DELAY),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=60, step=0.05, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_MOTOR_DISPATCH,
+                default=defaults.get(CONF_MOTOR_DISPATCH, DEFAULT_MOTOR_DISPATCH),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[
+                        {"value": m, "label": _MOTOR_DISPATCH_LABELS[m]}
+                        for m in MOTOR_DISPATCH_MODES
+                    ],
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(
+                CONF_MOTOR_CONFIRM_TIMEOUT,
+                default=defaults.get(CONF_MOTOR_CONFIRM_TIMEOUT, DEFAULT_MOTOR_CONFIRM_TIMEOUT),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1, max=120, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_MOTOR_COMMAND_INTERVAL,
+                default=defaults.get(CONF_MOTOR_COMMAND_INTERVAL, DEFAULT_MOTOR_COMMAND_INTERVAL),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=30, step=0.1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_MOTOR_COMMAND_BURST,
+                default=defaults.get(CONF_MOTOR_COMMAND_BURST, DEFAULT_MOTOR_COMMAND_BURST),
+            ): NumberSelector(
+                NumberSelectorConfig(min=1, max=10, step=1, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_DRIFT_RECONCILE_INTERVAL,
+                default=defaults.get(
+                    CONF_DRIFT_RECONCILE_INTERVAL, DEFAULT_DRIFT_RECONCILE_INTERVAL
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=3600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_DRIFT_GRACE,
+                default=defaults.get(CONF_DRIFT_GRACE, DEFAULT_DRIFT_GRACE),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_CALL_TIMEOUT,
+                default=defaults.get(CONF_CALL_TIMEOUT, DEFAULT_CALL_TIMEOUT),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1, max=120, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_CALL_RETRIES,
+                default=defaults.get(CONF_CALL_RETRIES, DEFAULT_CALL_RETRIES),
+            ): NumberSelector(
+                NumberSelectorConfig(min=0, max=10, step=1, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_BREAKER_THRESHOLD,
+                default=defaults.get(CONF_BREAKER_THRESHOLD, DEFAULT_BREAKER_THRESHOLD),
+            ): NumberSelector(
+                NumberSelectorConfig(min=1, max=20, step=1, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_BREAKER_RESET,
+                default=defaults.get(CONF_BREAKER_RESET, DEFAULT_BREAKER_RESET),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=5, max=3600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_VENT_BATCH_WINDOW,
+                default=defaults.get(CONF_VENT_BATCH_WINDOW, DEFAULT_VENT_BATCH_WINDOW),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=5, step=0.05, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_VENT_MAX_IN_FLIGHT,
+                default=defaults.get(CONF_VENT_MAX_IN_FLIGHT, DEFAULT_VENT_MAX_IN_FLIGHT),
+            ): NumberSelector(
+                NumberSelectorConfig(min=0, max=50, step=1, mode=NumberSelectorMode.BOX)
+            ),
+            vol.Optional(
+                CONF_VENT_COMMAND_SPACING,
+                default=defaults.get(CONF_VENT_COMMAND_SPACING, DEFAULT_VENT_COMMAND_SPACING),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=10, step=0.05, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_VENT_ANTICIPATION,
+                default=defaults.get(CONF_VENT_ANTICIPATION, DEFAULT_VENT_ANTICIPATION),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=1800, step=10, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+            vol.Optional(
+                CONF_OPTIMAL_START_MAX,
+                default=defaults.get(CONF_OPTIMAL_START_MAX, DEFAULT_OPTIMAL_START_MAX),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=240, step=5, mode=NumberSelectorMode.BOX, unit_of_measurement="min"
+                )
+            ),
+            vol.Optional(
+                CONF_SENSOR_PRECISION,
+                default=defaults.get(CONF_SENSOR_PRECISION, DEFAULT_SENSOR_PRECISION),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=1, step=0.01, mode=NumberSelectorMode.BOX, unit_of_measurement="°"
+                )
+            ),
+            vol.Optional(
+                CONF_SENSOR_MIN_DELTA,
+                default=defaults.get(CONF_SENSOR_MIN_DELTA, DEFAULT_SENSOR_MIN_DELTA),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=2, step=0.01, mode=NumberSelectorMode.BOX, unit_of_measurement="°"
+                )
+            ),
+            vol.Optional(
+                CONF_SENSOR_MIN_INTERVAL,
+                default=defaults.get(CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0, max=600, step=1, mode=NumberSelectorMode.BOX, unit_of_measurement="s"
+                )
+            ),
+        }
+    )
+
+
 def _zone_schema(defaults: dict[str, Any]) -> vol.Schema:
     return vol.Schema(
         {
@@ -182,6 +398,27 @@ def _validate_global(user_input: dict[str, Any]) -> dict[str, str]:
     return errors
 
 
+def _validate_presets(user_input: dict[str, Any]) -> dict[str, str]:
+    errors: dict[str, str] = {}
+    if (error := validate_presets(user_input.get(CONF_PRESETS, {}))) is not None:
+        errors[CONF_PRESETS] = error
+    return errors
+
+
+def _validate_schedules(user_input: dict[str, Any]) -> dict[str, str]:
+    errors: dict[str, str] = {}
+    if (error := validate_schedules(user_input.get(CONF_SCHEDULES, {}))) is not None:
+        errors[CONF_SCHEDULES] = error
+    return errors
+
+
+def _validate_advanced(user_input: dict[str, Any]) -> dict[str, str]:
+    errors: dict[str, str] = {}
+    if user_input[CONF_SYNC_MAX_DELAY] < user_input[CONF_SYNC_QUIET_WINDOW]:
+        errors[CONF_SYNC_MAX_DELAY] = "sync_delay_invalid"
+    return errors
+
+
 class DuctedHVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Multi-step config flow for Ducted HVAC.
 
@@ -330,8 +567,14 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
 
     Menu:
       global_settings  → edit motor, modes, temperature bounds, etc.
+      advanced         → tune motor sync timing
+      presets          → define entry-wide presets (eco, away, …)
+      schedules        → define weekly per-zone schedules
       add_zone         → add a new zone
       delete_zone      → remove an existing zone
+
+    Each step only updates the entry data; the entry's update listener applies
+    zone changes live and reloads the entry for anything else.
     """
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
@@ -347,7 +590,15 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
     ) -> config_entries.ConfigFlowResult:
         return self.async_show_menu(
             step_id="init",
-            menu_options=["global_settings", "add_zone", "edit_zone", "delete_zone"],
+            menu_options=[
+                "global_settings",
+                "advanced",
+                "presets",
+                "schedules",
+                "add_zone",
+                "edit_zone",
+                "delete_zone",
+            ],
         )
 
     # ------------------------------------------------------------------
@@ -368,9 +619,6 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
                     modes.insert(0, "off")
                 updated = {**current, **user_input, CONF_MODES: modes}
                 self.hass.config_entries.async_update_entry(self._entry, data=updated)
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._entry.entry_id)
-                )
                 return self.async_create_entry(title="", data={})
 
         # Pre-fill with current values; exclude "off" from the mode picker
@@ -392,6 +640,87 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    # ------------------------------------------------------------------
+    # Edit advanced tuning
+    # ------------------------------------------------------------------
+
+    async def async_step_advanced(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        errors: dict[str, str] = {}
+        current = self._entry.data
+
+        if user_input is not None:
+            errors = _validate_advanced(user_input)
+            if not errors:
+                updated = {**current, **user_input}
+                self.hass.config_entries.async_update_entry(self._entry, data=updated)
+                return self.async_create_entry(title="", data={})
+
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=_advanced_schema(current),
+            errors=errors,
+        )
+
+    # ------------------------------------------------------------------
+    # Edit presets
+    # ------------------------------------------------------------------
+
+    async def async_step_presets(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        errors: dict[str, str] = {}
+        current = self._entry.data
+
+        if user_input is not None:
+            errors = _validate_presets(user_input)
+            if not errors:
+                updated = {**current, CONF_PRESETS: user_input.get(CONF_PRESETS, {})}
+                self.hass.config_entries.async_update_entry(self._entry, data=updated)
+                return self.async_create_entry(title="", data={})
+
+        return self.async_show_form(
+            step_id="presets",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_PRESETS, default=current.get(CONF_PRESETS, {})
+                    ): ObjectSelector(),
+                }
+            ),
+            errors=errors,
+        )
+
+    # ------------------------------------------------------------------
+    # Edit schedules
+    # ------------------------------------------------------------------
+
+    async def async_step_schedules(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        errors: dict[str, str] = {}
+        current = self._entry.data
+
+        if user_input is not None:
+            errors = _validate_schedules(user_input)
+            if not errors:
+                updated = {**current, CONF_SCHEDULES: user_input.get(CONF_SCHEDULES, {})}
+                self.hass.config_entries.async_update_entry(self._entry, data=updated)
+                return self.async_create_entry(title="", data={})
+
+        return self.async_show_form(
+            step_id="schedules",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_SCHEDULES, default=current.get(CONF_SCHEDULES, {})
+                    ): ObjectSelector(),
+                }
+            ),
+            errors=errors,
+        )
+
     # ------------------------------------------------------------------
     # Add a zone
     # ------------------------------------------------------------------
@@ -416,9 +745,6 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
                 zones.append(_build_zone_entry(user_input))
                 updated = {**current, CONF_ZONES: zones}
                 self.hass.config_entries.async_update_entry(self._entry, data=updated)
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._entry.entry_id)
-                )
                 return self.async_create_entry(title="", data={})
 
         return self.async_show_form(
@@ -495,9 +821,6 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
                 self.hass.config_entries.async_update_entry(
                     self._entry, data={**current, CONF_ZONES: updated_zones}
                 )
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._entry.entry_id)
-                )
                 return self.async_create_entry(title="", data={})
 
         return self.async_show_form(
@@ -530,9 +853,6 @@ class DuctedHVACOptionsFlow(config_entries.OptionsFlow):
             else:
                 updated = {**current, CONF_ZONES: updated_zones}
                 self.hass.config_entries.async_update_entry(self._entry, data=updated)
-                self.hass.async_create_task(
-                    self.hass.config_entries.async_reload(self._entry.entry_id)
-                )
                 return self.async_create_entry(title="", data={})
 
         zone_options = [
@@ -0,0 +1,92 @@
+"""Sensor ingest filter for ducted_hvac.
+
+Temperature sensors often report far more often than the value meaningfully
+changes. The filter rounds readings to a configured precision, drops those
+that differ from the last delivered value by less than a minimum delta, and
+rate-limits delivery to one reading per interval. A reading held back by the
+interval is delivered on the trailing edge if it is still the latest one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+
+class SensorIngestFilter:
+    """Filters raw sensor readings before they reach a zone."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        deliver: Callable[[float], None],
+        precision: float = 0.0,
+        min_delta: float = 0.0,
+        min_interval: float = 0.0,
+    ) -> None:
+        self._hass = hass
+        self._deliver = deliver
+        self._precision = precision
+        self._min_delta = min_delta
+        self._min_interval = min_interval
+
+        self._last_delivery: float | None = None  # loop time
+        self._pending: float | None = None
+        self._trailing_handle = None
+
+    def quantize(self, value: float) -> float:
+        """Round ``value`` to the configured precision (no-op when disabled)."""
+        if self._precision <= 0:
+            return value
+        return round(round(value / self._precision) * self._precision, 6)
+
+    @callback
+    def async_ingest(self, value: float, reference: float | None) -> None:
+        """Deliver ``value`` now, later, or never.
+
+        ``reference`` is the value the zone currently shows; readings that would
+        not visibly change it are dropped without a state write.
+        """
+        value = self.quantize(value)
+        if reference is not None and (
+            value == reference or abs(value - reference) < self._min_delta
+        ):
+            # Back to (or still near) the shown value — nothing to deliver
+            self._pending = None
+            self._cancel_trailing()
+            return
+
+        now = self._hass.loop.time()
+        if self._min_interval > 0 and self._last_delivery is not None:
+            due = self._last_delivery + self._min_interval
+            if now < due:
+                self._pending = value
+                if self._trailing_handle is None:
+                    self._trailing_handle = self._hass.loop.call_at(due, self._async_trailing)
+                return
+
+        self._send(value, now)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Discard any reading waiting for the trailing edge."""
+        self._pending = None
+        self._cancel_trailing()
+
+    @callback
+    def _async_trailing(self) -> None:
+        self._trailing_handle = None
+        if self._pending is not None:
+            self._send(self._pending, self._hass.loop.time())
+
+    def _send(self, value: float, now: float) -> None:
+        self._pending = None
+        self._cancel_trailing()
+        self._last_delivery = now
+        self._deliver(value)
+
+    def _cancel_trailing(self) -> None:
+        if self._trailing_handle is not None:
+            self._trailing_handle.cancel()
+            self._trailing_handle = None
@@ -0,0 +1,196 @@
+"""Motor command planner for ducted_hvac.
+
+Diffs the desired motor state against the motor entity's live state and
+returns the smallest list of climate service calls needed to converge.
+MotorCapabilities describes what the motor accepts (modes, fan modes,
+setpoint range and step) so commands can be shaped to fit before planning.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.components.climate import ClimateEntityFeature
+from homeassistant.components.climate.const import (
+    ATTR_FAN_MODES,
+    ATTR_HVAC_MODES,
+    ATTR_MAX_TEMP,
+    ATTR_MIN_TEMP,
+    ATTR_TARGET_TEMP_STEP,
+    HVACMode,
+)
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import State
+
+# Setpoints closer than this are considered equal
+TEMP_EPSILON = 0.01
+
+
+@dataclass(frozen=True)
+class MotorCommand:
+    """A single climate service call targeting the motor entity."""
+
+    service: str
+    data: dict[str, Any]
+
+    @property
+    def sets_mode(self) -> bool:
+        """Return True if this command changes the motor's HVAC mode."""
+        return self.service == "turn_off" or "hvac_mode" in self.data
+
+
+@dataclass
+class MotorPlan:
+    """Commands to send plus the number of calls avoided versus a blind sync."""
+
+    commands: list[MotorCommand] = field(default_factory=list)
+    skipped: int = 0
+
+
+@dataclass(frozen=True)
+class MotorCapabilities:
+    """What the motor entity accepts, read from its state attributes.
+
+    None for any field means the motor does not advertise it and no
+    restriction applies.
+    """
+
+    hvac_modes: frozenset[str] | None = None
+    fan_modes: frozenset[str] | None = None
+    min_temp: float | None = None
+    max_temp: float | None = None
+    temp_step: float | None = None
+
+    @classmethod
+    def from_state(cls, state: State | None) -> MotorCapabilities | None:
+        """Read capabilities from ``state``, or None if the motor is unavailable."""
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return None
+        attrs = state.attributes
+        modes = attrs.get(ATTR_HVAC_MODES)
+        fan_modes = attrs.get(ATTR_FAN_MODES)
+        return cls(
+            hvac_modes=frozenset(str(m) for m in modes) if modes else None,
+            fan_modes=frozenset(fan_modes) if fan_modes else None,
+            min_temp=_float_attr(attrs, ATTR_MIN_TEMP),
+            max_temp=_float_attr(attrs, ATTR_MAX_TEMP),
+            temp_step=_float_attr(attrs, ATTR_TARGET_TEMP_STEP),
+        )
+
+    def supports_mode(self, hvac_mode: str) -> bool:
+        return self.hvac_modes is None or hvac_mode in self.hvac_modes
+
+    def supports_fan_mode(self, fan_mode: str) -> bool:
+        return self.fan_modes is None or fan_mode in self.fan_modes
+
+    def normalize_temperature(self, temperature: float) -> float:
+        """Quantise ``temperature`` to the motor's step, then clamp it to its range."""
+        if self.temp_step:
+            temperature = round(round(temperature / self.temp_step) * self.temp_step, 6)
+        if self.min_temp is not None:
+            temperature = max(temperature, self.min_temp)
+        if self.max_temp is not None:
+            temperature = min(temperature, self.max_temp)
+        return temperature
+
+
+def _float_attr(attrs, key: str) -> float | None:
+    try:
+        return float(attrs[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def command_satisfied_by(command: MotorCommand) -> Callable[[State], bool]:
+    """Return a predicate telling whether a motor state reflects ``command``."""
+
+    def _satisfied(state: State) -> bool:
+        if command.service == "turn_off":
+            return state.state == HVACMode.OFF
+        if (mode := command.data.get("hvac_mode")) is not None and state.state != mode:
+            return False
+        if (temp := command.data.get("temperature")) is not None:
+            cur = _current_temp(state)
+            if cur is None or abs(cur - temp) >= TEMP_EPSILON:
+                return False
+        if (fan := command.data.get("fan_mode")) is not None:
+            return state.attributes.get("fan_mode") == fan
+        return True
+
+    return _satisfied
+
+
+def _current_temp(state: State) -> float | None:
+    try:
+        return float(state.attributes["temperature"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def plan_motor_commands(
+    current: State | None,
+    hvac_mode: str | None,
+    temperature: float | None,
+    fan_mode: str | None,
+    capabilities: MotorCapabilities | None = None,
+) -> MotorPlan:
+    """Return the minimal command list to bring the motor to the desired state.
+
+    ``hvac_mode`` of None means the motor should be off. When the motor state
+    is missing or unavailable nothing is known about it, so every command is sent.
+    Mode and temperature are folded into a single ``set_temperature`` call when
+    the motor advertises TARGET_TEMPERATURE support.
+
+    With ``capabilities``, a mode or fan mode the motor does not accept is left
+    unchanged instead of being sent. The caller normalises the temperature.
+    """
+    known = current is not None and current.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE)
+
+    if hvac_mode is None or hvac_mode == HVACMode.OFF:
+        if known and current.state == HVACMode.OFF:
+            return MotorPlan(skipped=1)
+        return MotorPlan(commands=[MotorCommand("turn_off", {})])
+
+    if capabilities is not None:
+        if fan_mode is not None and not capabilities.supports_fan_mode(fan_mode):
+            fan_mode = None
+        supports_mode = capabilities.supports_mode(hvac_mode)
+    else:
+        supports_mode = True
+
+    # Number of calls an unconditional sync would have made
+    baseline = int(supports_mode) + (temperature is not None) + (fan_mode is not None)
+
+    need_mode = supports_mode and (not known or current.state != hvac_mode)
+    need_temp = temperature is not None and (
+        not known
+        or (cur := _current_temp(current)) is None
+        or abs(cur - temperature) >= TEMP_EPSILON
+    )
+    need_fan = fan_mode is not None and (
+        not known or current.attributes.get("fan_mode") != fan_mode
+    )
+
+    supports_temp = known and bool(
+        (current.attributes.get("supported_features") or 0)
+        & ClimateEntityFeature.TARGET_TEMPERATURE
+    )
+
+    commands: list[MotorCommand] = []
+    if need_mode and need_temp and supports_temp:
+        commands.append(
+            MotorCommand(
+                "set_temperature", {"hvac_mode": hvac_mode, "temperature": temperature}
+            )
+        )
+    else:
+        if need_mode:
+            commands.append(MotorCommand("set_hvac_mode", {"hvac_mode": hvac_mode}))
+        if need_temp:
+            commands.append(MotorCommand("set_temperature", {"temperature": temperature}))
+    if need_fan:
+        commands.append(MotorCommand("set_fan_mode", {"fan_mode": fan_mode}))
+
+    return MotorPlan(commands=commands, skipped=baseline - len(commands))
@@ -0,0 +1,180 @@
+"""Entry-wide presets for ducted_hvac.
+
+A preset maps every zone of a config entry to a mode and a setpoint, either
+absolute or as an offset from the zone's own setpoint. Presets are stored in
+the entry data as::
+
+    {"eco": {"temperature_offset": -2,
+             "zones": {"bedroom": {"hvac_mode": "off"}}}}
+
+Top-level values apply to all zones; ``zones`` overrides them per zone
+unique_id. Activating a preset changes every zone at once, with one batch of
+vent commands and a single motor sync. The zones' own values are snapshotted
+on the first activation and restored by switching back to ``none``, so
+switching between presets never compounds offsets. Changing a zone's mode
+or setpoint by hand takes that zone out of the preset, so its new values
+are kept when the others return to ``none``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.climate.const import PRESET_NONE, HVACMode
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+PRESET_HVAC_MODE = "hvac_mode"
+PRESET_TEMPERATURE = "temperature"
+PRESET_TEMPERATURE_OFFSET = "temperature_offset"
+PRESET_ZONES = "zones"
+
+_PRESET_KEYS = {PRESET_HVAC_MODE, PRESET_TEMPERATURE, PRESET_TEMPERATURE_OFFSET}
+
+
+def validate_presets(presets: Any) -> str | None:
+    """Return an error key if ``presets`` is not a valid preset mapping."""
+    if not isinstance(presets, dict):
+        return "presets_invalid"
+    for name, preset in presets.items():
+        if not isinstance(name, str) or name == PRESET_NONE or not isinstance(preset, dict):
+            return "presets_invalid"
+        zones = preset.get(PRESET_ZONES, {})
+        if not isinstance(zones, dict):
+            return "presets_invalid"
+        for target in (preset, *zones.values()):
+            if not isinstance(target, dict) or _validate_target(target) is not None:
+                return "presets_invalid"
+    return None
+
+
+def _validate_target(target: dict) -> str | None:
+    if (mode := target.get(PRESET_HVAC_MODE)) is not None:
+        if mode not in {m.value for m in HVACMode}:
+            return "presets_invalid"
+    for key in (PRESET_TEMPERATURE, PRESET_TEMPERATURE_OFFSET):
+        if key in target and not isinstance(target[key], (int, float)):
+            return "presets_invalid"
+    return None
+
+
+class PresetManager:
+    """Holds an entry's preset definitions, the active preset and the snapshot."""
+
+    def __init__(self, hass: HomeAssistant, coordinator, presets: dict[str, dict]) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._presets = presets
+        self._active: str = PRESET_NONE
+        # zone unique_id → (hvac_mode, target temperature) before the preset
+        self._snapshot: dict[str, tuple[HVACMode, float]] | None = None
+
+    @property
+    def preset_modes(self) -> list[str]:
+        """Selectable presets including ``none``, or empty if none are defined."""
+        return [PRESET_NONE, *self._presets] if self._presets else []
+
+    @property
+    def active(self) -> str:
+        """Name of the active preset, or ``none``."""
+        return self._active
+
+    def saved(self, unique_id: str) -> tuple[HVACMode, float] | None:
+        """The zone's values from before the active preset, if one is active."""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.get(unique_id)
+
+    @callback
+    def async_restore(self, unique_id: str, preset: str, saved: tuple[HVACMode, float]) -> None:
+        """Re-establish a preset that was active before a restart."""
+        if preset not in self._presets:
+            return
+        if self._active not in (PRESET_NONE, preset):
+            return  # zones disagree; the first one restored wins
+        self._active = preset
+        if self._snapshot is None:
+            self._snapshot = {}
+        self._snapshot[unique_id] = saved
+
+    def is_active_for(self, unique_id: str) -> bool:
+        """Return True if the active preset still applies to the zone."""
+        return self._snapshot is not None and unique_id in self._snapshot
+
+    @callback
+    def async_leave(self, unique_id: str) -> None:
+        """Take a zone out of the active preset after a manual change.
+
+        The preset ends once no zone is left in it.
+        """
+        if self._snapshot is None or self._snapshot.pop(unique_id, None) is None:
+            return
+        if not self._snapshot:
+            self._snapshot = None
+            self._active = PRESET_NONE
+
+    @callback
+    def async_update_saved(
+        self, unique_id: str, hvac_mode: HVACMode | None, temperature: float | None
+    ) -> bool:
+        """Change a zone's saved values while a preset is active.
+
+        Returns False if no preset is active, in which case the caller applies
+        the values to the zone directly.
+        """
+        if self._snapshot is None or unique_id not in self._snapshot:
+            return False
+        saved_mode, saved_temp = self._snapshot[unique_id]
+        self._snapshot[unique_id] = (
+            hvac_mode if hvac_mode is not None else saved_mode,
+            temperature if temperature is not None else saved_temp,
+        )
+        return True
+
+    async def async_activate(self, preset: str) -> None:
+        """Switch every zone to ``preset`` (or back to its own values for ``none``)."""
+        if preset != PRESET_NONE and preset not in self._presets:
+            raise ValueError(f"Unknown preset {preset}")
+        zones = list(self._coordinator.zones)
+
+        if preset == PRESET_NONE:
+            snapshot, self._snapshot = self._snapshot, None
+            self._active = PRESET_NONE
+            if snapshot is None:
+                return
+            for zone in zones:
+                if (saved := snapshot.get(zone.unique_id)) is not None:
+                    zone.async_set_state(*saved)
+                else:
+                    zone.async_write_ha_state()
+        else:
+            if self._snapshot is None:
+                self._snapshot = {}
+            for zone in zones:
+                self._snapshot.setdefault(
+                    zone.unique_id, (zone.hvac_mode, zone.target_temperature)
+                )
+            self._active = preset
+            for zone in zones:
+                mode, temperature = self._target(preset, zone)
+                zone.async_set_state(mode, temperature)
+
+        _LOGGER.debug("Preset %s applied to %d zones", preset, len(zones))
+        await self._coordinator.async_evaluate_zones(zones)
+
+    def _target(self, preset: str, zone) -> tuple[HVACMode | None, float | None]:
+        """Mode and setpoint ``preset`` gives ``zone``, measured from its snapshot."""
+        definition = self._presets[preset]
+        target = {
+            **{k: v for k, v in definition.items() if k in _PRESET_KEYS},
+            **definition.get(PRESET_ZONES, {}).get(zone.unique_id, {}),
+        }
+        base_mode, base_temp = self._snapshot[zone.unique_id]
+
+        mode = target.get(PRESET_HVAC_MODE)
+        mode = HVACMode(mode) if mode is not None and mode in zone.hvac_modes else base_mode
+        if (temperature := target.get(PRESET_TEMPERATURE)) is None:
+            temperature = base_temp + target.get(PRESET_TEMPERATURE_OFFSET, 0)
+        return mode, float(temperature)
@@ -0,0 +1,174 @@
+"""Token-bucket rate limiter for motor commands in ducted_hvac.
+
+Some motors (IR blasters in particular) drop commands that arrive too close
+together. All motor commands are queued here and released at most ``burst``
+at a time, refilling one token every ``interval`` seconds.
+
+Queued commands are keyed by the attribute they change. A newer command for
+the same attribute replaces the queued one (merged) and moves to the back of
+the queue, so commands still go out in the order they were decided. A mode
+command carrying a setpoint also replaces a queued setpoint command. A queued
+``turn_off`` discards pending mode, setpoint and fan commands, and a mode
+command discards a pending ``turn_off`` (dropped). Only the latest intent per
+attribute is sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, State, callback
+
+from .planner import MotorCommand
+
+_LOGGER = logging.getLogger(__name__)
+
+KEY_POWER = "power"
+KEY_MODE = "hvac_mode"
+KEY_TEMPERATURE = "temperature"
+KEY_FAN = "fan_mode"
+
+
+def command_key(command: MotorCommand) -> str:
+    """Return the attribute a command changes; folded mode+setpoint counts as mode."""
+    if command.service == "turn_off":
+        return KEY_POWER
+    if KEY_MODE in command.data:
+        return KEY_MODE
+    if KEY_FAN in command.data:
+        return KEY_FAN
+    return KEY_TEMPERATURE
+
+
+class MotorCommandQueue:
+    """Rate-limited, merging queue in front of the motor's service calls."""
+
+    def __init__(self, hass: HomeAssistant, interval: float, burst: int = 1) -> None:
+        self._hass = hass
+        self._interval = interval
+        self._burst = max(burst, 1)
+        self._tokens = float(self._burst)
+        self._refilled = hass.loop.time()
+
+        # key → (command, sender, future); dict order is send order
+        self._queue: dict[
+            str, tuple[MotorCommand, Callable[[], Awaitable[bool]], asyncio.Future]
+        ] = {}
+        self._in_flight: MotorCommand | None = None
+        self._worker: asyncio.Task | None = None
+
+        self._merged = 0
+        self._dropped = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of commands waiting for a token."""
+        return len(self._queue)
+
+    @property
+    def merged(self) -> int:
+        """Commands replaced by a newer command for the same attribute."""
+        return self._merged
+
+    @property
+    def dropped(self) -> int:
+        """Commands discarded because a turn_off or mode change made them moot."""
+        return self._dropped
+
+    @callback
+    def async_submit(
+        self, command: MotorCommand, send: Callable[[], Awaitable[bool]]
+    ) -> asyncio.Future[bool]:
+        """Queue ``command``; ``send`` performs the call once a token is available.
+
+        The returned future resolves to the send result, or False if the command
+        was merged into a newer one or dropped.
+        """
+        key = command_key(command)
+        future: asyncio.Future[bool] = self._hass.loop.create_future()
+
+        if key == KEY_POWER:
+            self._discard((KEY_MODE, KEY_TEMPERATURE, KEY_FAN))
+        elif key == KEY_MODE:
+            self._discard((KEY_POWER,))
+
+        replaced = [key]
+        if key == KEY_MODE and KEY_TEMPERATURE in command.data:
+            replaced.append(KEY_TEMPERATURE)
+        for old_key in replaced:
+            if (old := self._queue.pop(old_key, None)) is not None:
+                self._merged += 1
+                if not old[2].done():
+                    old[2].set_result(False)
+        # Appended last: it must not overtake commands queued after the one it replaced
+        self._queue[key] = (command, send, future)
+
+        if self._worker is None or self._worker.done():
+            self._worker = self._hass.async_create_task(self._async_drain())
+        return future
+
+    def expected(self, state: State | None) -> State | None:
+        """Return ``state`` as it will look once in-flight and queued commands apply."""
+        pending = [self._in_flight] if self._in_flight is not None else []
+        pending.extend(command for command, _, _ in self._queue.values())
+        if state is None or not pending:
+            return state
+
+        hvac_state = state.state
+        attributes = dict(state.attributes)
+        for command in pending:
+            if command.service == "turn_off":
+                hvac_state = HVACMode.OFF
+            for attr, value in command.data.items():
+                if attr == KEY_MODE:
+                    hvac_state = value
+                else:
+                    attributes[attr] = value
+        return State(state.entity_id, hvac_state, attributes)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Discard queued commands and stop the worker."""
+        self._discard(tuple(self._queue), count=False)
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def _discard(self, keys: tuple[str, ...], count: bool = True) -> None:
+        for key in keys:
+            if (old := self._queue.pop(key, None)) is not None:
+                if count:
+                    self._dropped += 1
+                if not old[2].done():
+                    old[2].set_result(False)
+
+    async def _async_drain(self) -> None:
+        while self._queue:
+            await self._async_take_token()
+            if not self._queue:
+                return
+            key = next(iter(self._queue))
+            command, send, future = self._queue.pop(key)
+            self._in_flight = command
+            try:
+                result = await send()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Motor command %s failed", command)
+                result = False
+            finally:
+                self._in_flight = None
+            if not future.done():
+                future.set_result(result)
+
+    async def _async_take_token(self) -> None:
+        now = self._hass.loop.time()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled) / self._interval)
+        self._refilled = now
+        if self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) * self._interval)
+            self._tokens = 1.0
+            self._refilled = self._hass.loop.time()
+        self._tokens -= 1
@@ -0,0 +1,218 @@
+"""Timeouts, retries and circuit breakers for ducted_hvac service calls.
+
+Motor and vent commands go through a ServiceCaller, which bounds each call
+with a timeout, retries failures with exponential backoff and jitter, and
+keeps a circuit breaker per target entity. While a breaker is open, calls to
+that entity fail fast; once the reset timeout passes the breaker goes
+half-open and its probe callback lets the owner retry in the background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Errors that retrying cannot fix
+_PERMANENT_ERRORS = (vol.Invalid, ServiceValidationError)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an entity whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Per-entity breaker: closed → open after repeated failures → half-open probe."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_id: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        self._hass = hass
+        self.entity_id = entity_id
+        self._failure_threshold = max(failure_threshold, 1)
+        self._reset_timeout = reset_timeout
+        self._on_change = on_change
+        self._failures = 0
+        self._state = BREAKER_CLOSED
+        self._unsub_reset = None
+        self.on_probe: Callable[[], None] | None = None
+
+    @property
+    def state(self) -> str:
+        """One of closed, open or half_open."""
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted (closed, or a half-open probe)."""
+        return self._state != BREAKER_OPEN
+
+    @callback
+    def record_success(self) -> None:
+        self._failures = 0
+        self._cancel_reset()
+        self._set_state(BREAKER_CLOSED)
+
+    @callback
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == BREAKER_HALF_OPEN or self._failures >= self._failure_threshold:
+            self._cancel_reset()
+            self._unsub_reset = async_call_later(
+                self._hass, self._reset_timeout, self._async_half_open
+            )
+            self._set_state(BREAKER_OPEN)
+
+    @callback
+    def async_shutdown(self) -> None:
+        self._cancel_reset()
+
+    @callback
+    def _async_half_open(self, _now) -> None:
+        self._unsub_reset = None
+        self._set_state(BREAKER_HALF_OPEN)
+        if self.on_probe is not None:
+            self.on_probe()
+
+    def _set_state(self, state: str) -> None:
+        if state == self._state:
+            return
+        _LOGGER.info("Circuit for %s is now %s", self.entity_id, state)
+        self._state = state
+        if self._on_change is not None:
+            self._on_change()
+
+    def _cancel_reset(self) -> None:
+        if self._unsub_reset is not None:
+            self._unsub_reset()
+            self._unsub_reset = None
+
+
+class ServiceCaller:
+    """Calls services with a deadline, retry with backoff, and per-entity breakers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout: float,
+        retries: int,
+        failure_threshold: int,
+        reset_timeout: float,
+        backoff: float = 0.5,
+    ) -> None:
+        self._hass = hass
+        self._timeout = timeout
+        self._retries = retries
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._backoff = backoff
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.on_change: Callable[[], None] | None = None
+
+    def breaker(self, entity_id: str) -> CircuitBreaker:
+        """Return the breaker for ``entity_id``, creating it on first use."""
+        if (breaker := self._breakers.get(entity_id)) is None:
+            breaker = self._breakers[entity_id] = CircuitBreaker(
+                self._hass,
+                entity_id,
+                self._failure_threshold,
+                self._reset_timeout,
+                on_change=self._async_breaker_changed,
+            )
+        return breaker
+
+    def allows(self, entity_id: str) -> bool:
+        """Return True unless ``entity_id``'s breaker is open."""
+        breaker = self._breakers.get(entity_id)
+        return breaker is None or breaker.allow()
+
+    @property
+    def breaker_states(self) -> dict[str, str]:
+        """States of all breakers that are not closed, keyed by entity ID."""
+        return {
+            entity_id: breaker.state
+            for entity_id, breaker in self._breakers.items()
+            if breaker.state != BREAKER_CLOSED
+        }
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        entity_ids: list[str],
+        data: dict[str, Any] | None = None,
+        *,
+        blocking: bool = True,
+        retry: bool = True,
+        slot: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    ) -> None:
+        """Call ``domain.service`` on ``entity_ids``.
+
+        Raises CircuitOpenError without calling if any target's breaker is open.
+        With ``retry`` False the call is attempted once and a failure is not
+        held against the breakers, for callers that fall back to per-entity calls.
+        ``slot`` is entered around each attempt only, not around the backoff
+        between attempts.
+        """
+        if blocked := [e for e in entity_ids if not self.allows(e)]:
+            raise CircuitOpenError(f"Circuit open for {', '.join(blocked)}")
+
+        target = entity_ids[0] if len(entity_ids) == 1 else entity_ids
+        attempts = self._retries + 1 if retry else 1
+        for attempt in range(attempts):
+            try:
+                async with (slot or nullcontext)(), asyncio.timeout(self._timeout):
+                    await self._hass.services.async_call(
+                        domain, service, {"entity_id": target, **(data or {})}, blocking=blocking
+                    )
+            except _PERMANENT_ERRORS:
+                raise
+            except Exception as err:  # noqa: BLE001
+                if attempt + 1 >= attempts:
+                    if retry:
+                        for entity_id in entity_ids:
+                            self.breaker(entity_id).record_failure()
+                    raise
+                delay = self._backoff * 2**attempt * random.uniform(0.5, 1.5)
+                _LOGGER.debug(
+                    "%s.%s on %s failed (%s), retrying in %.2fs",
+                    domain,
+                    service,
+                    target,
+                    err or type(err).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            else:
+                for entity_id in entity_ids:
+                    self.breaker(entity_id).record_success()
+                return
+
+    @callback
+    def async_shutdown(self) -> None:
+        for breaker in self._breakers.values():
+            breaker.async_shutdown()
+
+    @callback
+    def _async_breaker_changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
@@ -0,0 +1,121 @@
+"""Entry-level state event router for ducted_hvac.
+
+Holds one state-change subscription covering every zone sensor and vent
+switch in a config entry and dispatches events to the owning zones through
+lookup tables, instead of each zone registering its own listeners.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ZoneEventRouter:
+    """Routes sensor and vent state changes to zones through a single subscription.
+
+    Zones register in async_added_to_hass and unregister on removal. Changes
+    to the set of watched entities are coalesced into one resubscription per
+    event-loop iteration, so registering many zones at startup, or adding,
+    editing and removing one later, never tears down more than the listener.
+    All zones sharing a sensor are dispatched from the same callback, so their
+    vent decisions land in the same event-loop tick.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._by_sensor: dict[str, list] = {}  # sensor entity_id → list[DuctedHVACZone]
+        self._by_vent: dict[str, list] = {}  # vent entity_id → list[DuctedHVACZone]
+        self._unsub = None
+        self._resubscribe_scheduled = False
+
+    @callback
+    def async_register(self, zone) -> None:
+        """Start routing events for ``zone``'s sensor and vent to ``zone``."""
+        self._add(self._by_sensor, zone.sensor_entity_id, zone)
+        self._add(self._by_vent, zone.vent_entity_id, zone)
+
+    @callback
+    def async_unregister(
+        self,
+        zone,
+        sensor_entity_id: str | None = None,
+        vent_entity_id: str | None = None,
+    ) -> None:
+        """Stop routing events to ``zone``.
+
+        The entity IDs default to the zone's current sensor and vent; pass the
+        old ones when the zone has just been re-pointed to different entities.
+        """
+        self._remove(self._by_sensor, sensor_entity_id or zone.sensor_entity_id, zone)
+        self._remove(self._by_vent, vent_entity_id or zone.vent_entity_id, zone)
+
+    @callback
+    def async_repoint(
+        self,
+        zone,
+        old_sensor_entity_id: str | None = None,
+        old_vent_entity_id: str | None = None,
+    ) -> None:
+        """Move ``zone`` from its old sensor and vent to its current ones."""
+        self.async_unregister(zone, old_sensor_entity_id, old_vent_entity_id)
+        self.async_register(zone)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the subscription and forget all zones."""
+        self._by_sensor.clear()
+        self._by_vent.clear()
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def _add(self, table: dict[str, list], entity_id: str, zone) -> None:
+        zones = table.setdefault(entity_id, [])
+        if zone not in zones:
+            zones.append(zone)
+            if len(zones) == 1:
+                self._schedule_resubscribe()
+
+    def _remove(self, table: dict[str, list], entity_id: str, zone) -> None:
+        zones = table.get(entity_id)
+        if not zones or zone not in zones:
+            return
+        zones.remove(zone)
+        if not zones:
+            del table[entity_id]
+            self._schedule_resubscribe()
+
+    def _schedule_resubscribe(self) -> None:
+        if self._resubscribe_scheduled:
+            return
+        self._resubscribe_scheduled = True
+        self._hass.loop.call_soon(self._async_resubscribe)
+
+    @callback
+    def _async_resubscribe(self) -> None:
+        self._resubscribe_scheduled = False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if entity_ids := {*self._by_sensor, *self._by_vent}:
+            self._unsub = async_track_state_change_event(
+                self._hass, list(entity_ids), self._async_state_event
+            )
+        _LOGGER.debug(
+            "Routing state events for %d sensors and %d vents",
+            len(self._by_sensor),
+            len(self._by_vent),
+        )
+
+    @callback
+    def _async_state_event(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        for zone in self._by_sensor.get(entity_id, ()):
+            zone.async_sensor_changed(event)
+        for zone in self._by_vent.get(entity_id, ()):
+            zone.async_vent_state_changed(event)
@@ -0,0 +1,230 @@
+"""Weekly zone schedules for ducted_hvac.
+
+Schedules are stored in the entry data per zone unique_id::
+
+    {"bedroom": [{"days": ["mon", "tue"], "time": "06:30",
+                  "hvac_mode": "heat", "temperature": 21}]}
+
+They are compiled into transitions and kept in a heap ordered by next fire
+time, so the whole entry holds exactly one timer, for the earliest
+transition. Transitions due in the same minute are applied together, with
+one batch of vent commands and a single motor sync.
+
+With optimal start enabled, each setpoint transition also gets a check
+``max_lead`` before it is due. The check uses the zone's learned heating or
+cooling rate to work out when to start, and the transition is applied that
+early. Zones with different rates and gaps start at different times, which
+staggers demand instead of opening every vent at once.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+SCHEDULE_DAYS = "days"
+SCHEDULE_TIME = "time"
+SCHEDULE_HVAC_MODE = "hvac_mode"
+SCHEDULE_TEMPERATURE = "temperature"
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One weekly point at which a zone takes a new mode and/or setpoint."""
+
+    zone: str  # zone unique_id
+    weekday: int  # 0 = Monday
+    at: time
+    hvac_mode: HVACMode | None
+    temperature: float | None
+
+    def next_fire(self, after: datetime) -> datetime:
+        """Return the first UTC time strictly after ``after`` this transition fires.
+
+        Computed on the local calendar so it stays at the same wall-clock time
+        across daylight-saving changes.
+        """
+        local = dt_util.as_local(after)
+        day: date = local.date() + timedelta(days=(self.weekday - local.weekday()) % 7)
+        fire = dt_util.as_utc(datetime.combine(day, self.at, tzinfo=local.tzinfo))
+        if fire <= after:
+            fire = dt_util.as_utc(
+                datetime.combine(day + timedelta(days=7), self.at, tzinfo=local.tzinfo)
+            )
+        return fire
+
+
+def validate_schedules(schedules: Any) -> str | None:
+    """Return an error key if ``schedules`` is not a valid schedule mapping."""
+    try:
+        compile_schedules(schedules)
+    except (TypeError, ValueError, KeyError, AttributeError):
+        return "schedules_invalid"
+    return None
+
+
+def compile_schedules(schedules: dict[str, list[dict]]) -> list[Transition]:
+    """Expand per-zone schedule entries into one transition per weekday."""
+    if not isinstance(schedules, dict):
+        raise TypeError("schedules must be a mapping")
+    transitions = []
+    for zone, entries in schedules.items():
+        if not isinstance(entries, list):
+            raise TypeError("schedule entries must be a list")
+        for entry in entries:
+            at = time.fromisoformat(entry[SCHEDULE_TIME])
+            mode = entry.get(SCHEDULE_HVAC_MODE)
+            temperature = entry.get(SCHEDULE_TEMPERATURE)
+            if mode is None and temperature is None:
+                raise ValueError("schedule entry sets neither mode nor temperature")
+            for day in entry.get(SCHEDULE_DAYS, WEEKDAYS):
+                transitions.append(
+                    Transition(
+                        zone=str(zone),
+                        weekday=WEEKDAYS.index(day),
+                        at=at,
+                        hvac_mode=HVACMode(mode) if mode is not None else None,
+                        temperature=float(temperature) if temperature is not None else None,
+                    )
+                )
+    return transitions
+
+
+class ZoneScheduler:
+    """Fires schedule transitions for one entry from a single timer."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator,
+        presets,
+        thermal,
+        schedules: dict,
+        max_lead: timedelta = timedelta(0),
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._presets = presets  # PresetManager; active presets defer scheduled values
+        self._thermal = thermal  # ThermalRateLearner, for optimal start
+        self._max_lead = max_lead
+        self._transitions = compile_schedules(schedules)
+        # (fire time, seq, transition, due time if this is an optimal-start check)
+        self._heap: list[tuple[datetime, int, Transition, datetime | None]] = []
+        self._seq = itertools.count()  # tie-breaker so transitions never get compared
+        self._unsub_timer = None
+
+    @callback
+    def async_start(self) -> None:
+        """Build the timeline from now and arm the timer."""
+        now = dt_util.utcnow()
+        self._heap = []
+        for transition in self._transitions:
+            self._push(transition, transition.next_fire(now), now)
+        self._arm()
+
+    @callback
+    def async_update(self, schedules: dict) -> None:
+        """Replace the schedules and rebuild the timeline."""
+        self.async_shutdown()
+        self._transitions = compile_schedules(schedules)
+        self.async_start()
+
+    @callback
+    def async_shutdown(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._heap.clear()
+
+    def _push(self, transition: Transition, due: datetime, now: datetime) -> None:
+        """Queue ``transition`` for ``due``, preceded by an optimal-start check."""
+        heapq.heappush(self._heap, (due, next(self._seq), transition, None))
+        if self._max_lead and transition.temperature is not None:
+            check = max(due - self._max_lead, now)
+            heapq.heappush(self._heap, (check, next(self._seq), transition, due))
+
+    def _arm(self) -> None:
+        if self._heap:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self._hass, self._async_fire, self._heap[0][0]
+            )
+            _LOGGER.debug("Next schedule transition at %s", self._heap[0][0])
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Apply every transition due within the minute of the earliest one."""
+        self._unsub_timer = None
+        if not self._heap:
+            return
+        cutoff = self._heap[0][0].replace(second=0, microsecond=0) + timedelta(minutes=1)
+        popped = []
+        while self._heap and self._heap[0][0] < cutoff:
+            popped.append(heapq.heappop(self._heap))
+
+        due = []
+        for fire, _, transition, due_at in popped:
+            if due_at is None:
+                due.append(transition)
+                self._push(transition, transition.next_fire(fire), fire)
+            elif (start := self._optimal_start(transition, due_at)) is not None:
+                if start < cutoff:
+                    due.append(transition)  # early start
+                else:
+                    # Not yet: check again when the zone should start
+                    heapq.heappush(self._heap, (start, next(self._seq), transition, due_at))
+        self._arm()
+        if due:
+            self._hass.async_create_task(self._async_apply(due))
+
+    def _optimal_start(self, transition: Transition, due: datetime) -> datetime | None:
+        """When to start ``transition`` early, or None to wait for its due time."""
+        zone = next(
+            (z for z in self._coordinator.zones if z.unique_id == transition.zone), None
+        )
+        if zone is None:
+            return None
+        mode = transition.hvac_mode or zone.hvac_mode
+        if mode not in (HVACMode.HEAT, HVACMode.COOL):
+            return None
+        lead = min(
+            self._thermal.lead_time(
+                zone.unique_id, mode, zone.current_temperature, transition.temperature
+            ),
+            self._max_lead,
+        )
+        if not lead:
+            return None
+        return due - lead
+
+    async def _async_apply(self, transitions: list[Transition]) -> None:
+        zones = {zone.unique_id: zone for zone in self._coordinator.zones}
+        changed = []
+        for transition in transitions:
+            if (zone := zones.get(transition.zone)) is None:
+                continue
+            mode = transition.hvac_mode
+            if mode is not None and mode not in zone.hvac_modes:
+                _LOGGER.warning(
+                    "%s: scheduled mode %s is not configured, ignoring it", zone.name, mode
+                )
+                mode = None
+            if self._presets.async_update_saved(zone.unique_id, mode, transition.temperature):
+                continue  # a preset is active; the new values apply when it ends
+            zone.async_set_state(mode, transition.temperature)
+            changed.append(zone)
+        _LOGGER.debug("Applied %d schedule transitions", len(transitions))
+        if changed:
+            await self._coordinator.async_evaluate_zones(changed)
@@ -12,6 +12,7 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import DOMAIN, MotorCoordinator, build_device_info
+from .vent import VentActuator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +21,19 @@ ATTR_ACTIVE_FAN_MODE = "active_fan_mode"
 ATTR_MOTOR_TARGET_TEMP = "motor_target_temperature"
 ATTR_OPEN_ZONES = "open_zones"
 ATTR_CLOSED_ZONES = "closed_zones"
+ATTR_MOTOR_COMMANDS_SENT = "motor_commands_sent"
+ATTR_MOTOR_COMMANDS_SKIPPED = "motor_commands_skipped"
+ATTR_MOTOR_SYNC_LATENCY = "motor_sync_latency"
+ATTR_CIRCUIT_BREAKERS = "circuit_breakers"
+ATTR_MOTOR_QUEUE_DEPTH = "motor_queue_depth"
+ATTR_MOTOR_COMMANDS_MERGED = "motor_commands_merged"
+ATTR_MOTOR_COMMANDS_DROPPED = "motor_commands_dropped"
+ATTR_STARTUP_DURATION = "startup_duration"
+ATTR_MOTOR_DRIFTED = "motor_drifted"
+ATTR_MOTOR_DRIFT_COUNT = "motor_drift_count"
+ATTR_MOTOR_CONVERGE_TIME = "motor_converge_time"
+ATTR_VENT_COMMANDS_SENT = "vent_commands_sent"
+ATTR_VENT_COMMANDS_FAILED = "vent_commands_failed"
 
 
 async def async_setup_entry(
@@ -37,6 +51,7 @@ async def async_setup_entry(
             MotorCoordinatorSensor(
                 entry_id=entry.entry_id,
                 coordinator=coordinator,
+                actuator=domain_data["actuator"],
                 device_info=device_info,
             )
         ]
@@ -59,9 +74,11 @@ class MotorCoordinatorSensor(SensorEntity):
         self,
         entry_id: str,
         coordinator: MotorCoordinator,
+        actuator: VentActuator,
         device_info: DeviceInfo,
     ) -> None:
         self._coordinator = coordinator
+        self._actuator = actuator
         self._attr_unique_id = f"{entry_id}_coordinator_sensor"
         self._attr_device_info = device_info
         # Register for push notifications after each motor sync
@@ -70,19 +87,33 @@ class MotorCoordinatorSensor(SensorEntity):
     @property
     def native_value(self) -> str:
         """Return 'open/total' zone count, e.g. '2/3'."""
-        zones = self._coordinator.zones
-        open_count = sum(1 for z in zones if z.vent_is_open)
-        return f"{open_count}/{len(zones)}"
+        return f"{self._coordinator.open_zone_count}/{len(self._coordinator.zones)}"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        zones = self._coordinator.zones
+        open_zones: list[str] = []
+        closed_zones: list[str] = []
+        for zone in self._coordinator.zones:
+            (open_zones if zone.vent_is_open else closed_zones).append(zone.name)
         return {
             ATTR_ACTIVE_MODE: self._coordinator.last_active_mode,
             ATTR_ACTIVE_FAN_MODE: self._coordinator.last_fan_mode,
             ATTR_MOTOR_TARGET_TEMP: self._coordinator.last_motor_temp,
-            ATTR_OPEN_ZONES: [z.name for z in zones if z.vent_is_open],
-            ATTR_CLOSED_ZONES: [z.name for z in zones if not z.vent_is_open],
+            ATTR_OPEN_ZONES: open_zones,
+            ATTR_CLOSED_ZONES: closed_zones,
+            ATTR_MOTOR_COMMANDS_SENT: self._coordinator.commands_sent,
+            ATTR_MOTOR_COMMANDS_SKIPPED: self._coordinator.commands_skipped,
+            ATTR_MOTOR_SYNC_LATENCY: self._coordinator.last_sync_latency,
+            ATTR_CIRCUIT_BREAKERS: self._coordinator.circuit_states,
+            ATTR_MOTOR_QUEUE_DEPTH: self._coordinator.motor_queue_depth,
+            ATTR_MOTOR_COMMANDS_MERGED: self._coordinator.motor_commands_merged,
+            ATTR_MOTOR_COMMANDS_DROPPED: self._coordinator.motor_commands_dropped,
+            ATTR_STARTUP_DURATION: self._coordinator.startup_duration,
+            ATTR_MOTOR_DRIFTED: self._coordinator.motor_drifted,
+            ATTR_MOTOR_DRIFT_COUNT: self._coordinator.drift_count,
+            ATTR_MOTOR_CONVERGE_TIME: self._coordinator.last_converge_time,
+            ATTR_VENT_COMMANDS_SENT: self._actuator.commands_sent,
+            ATTR_VENT_COMMANDS_FAILED: self._actuator.commands_failed,
         }
 
     @callback
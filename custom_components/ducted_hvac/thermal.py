@@ -0,0 +1,120 @@
+"""Learned per-zone heating and cooling rates for ducted_hvac.
+
+While a zone's vent is open in heat or cool mode, consecutive temperature
+readings give the rate at which the zone approaches its target. Rates are
+kept as an exponentially weighted moving average per zone and mode, in
+degrees per minute, and persisted with a Store so they survive restarts.
+The scheduler uses them to start a transition early enough for the zone to
+reach its new setpoint on time.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+# Weight of a new sample in the moving average
+RATE_ALPHA = 0.2
+# Samples further apart than this (minutes) only re-baseline
+MAX_SAMPLE_GAP = 30.0
+# Samples closer than this (minutes) are too noisy to use
+MIN_SAMPLE_GAP = 0.5
+
+_LEARNED_MODES = (HVACMode.HEAT, HVACMode.COOL)
+
+
+class ThermalRateLearner:
+    """Learns how fast each zone heats and cools with its vent open."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._hass = hass
+        self._store: Store[dict[str, dict[str, float]]] = Store(
+            hass, STORAGE_VERSION, _storage_key(entry_id)
+        )
+        # zone unique_id → mode → degrees per minute towards the target
+        self._rates: dict[str, dict[str, float]] = {}
+        self._unsaved = False
+        # zone unique_id → (mode, temperature, loop time) of the last usable reading
+        self._last: dict[str, tuple[HVACMode, float, float]] = {}
+
+    async def async_load(self) -> None:
+        if (data := await self._store.async_load()) is not None:
+            self._rates = data
+
+    async def async_flush(self) -> None:
+        """Write unsaved rates now rather than after SAVE_DELAY, e.g. on unload."""
+        if self._unsaved:
+            await self._store.async_save(self._data_to_save())
+
+    def rate(self, unique_id: str, hvac_mode: HVACMode) -> float | None:
+        """Learned degrees per minute for ``hvac_mode``, or None if not learned yet."""
+        return self._rates.get(unique_id, {}).get(hvac_mode)
+
+    @callback
+    def async_observe(
+        self, unique_id: str, hvac_mode: HVACMode, vent_open: bool, temperature: float
+    ) -> None:
+        """Feed a reading; only readings taken with the vent open in heat/cool count."""
+        if not vent_open or hvac_mode not in _LEARNED_MODES:
+            self._last.pop(unique_id, None)
+            return
+
+        now = self._hass.loop.time()
+        last = self._last.get(unique_id)
+        if last is not None and last[0] == hvac_mode:
+            minutes = (now - last[2]) / 60
+            if minutes < MIN_SAMPLE_GAP:
+                return  # keep the baseline until the sample spans long enough
+        self._last[unique_id] = (hvac_mode, temperature, now)
+        if last is None or last[0] != hvac_mode or minutes > MAX_SAMPLE_GAP:
+            return
+
+        delta = temperature - last[1]
+        sample = (delta if hvac_mode == HVACMode.HEAT else -delta) / minutes
+        if sample <= 0:
+            return  # losing ground (door open, sun); not the unit's capacity
+
+        rates = self._rates.setdefault(unique_id, {})
+        old = rates.get(hvac_mode)
+        rates[hvac_mode] = round(
+            sample if old is None else old + RATE_ALPHA * (sample - old), 4
+        )
+        self._unsaved = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, dict[str, float]]:
+        self._unsaved = False
+        return self._rates
+
+    def lead_time(
+        self, unique_id: str, hvac_mode: HVACMode, current: float | None, target: float
+    ) -> timedelta:
+        """How early to start so the zone reaches ``target`` on time.
+
+        Zero when nothing is learned yet or the zone is already on the right
+        side of the target.
+        """
+        if current is None or (rate := self.rate(unique_id, hvac_mode)) is None:
+            return timedelta(0)
+        gap = target - current if hvac_mode == HVACMode.HEAT else current - target
+        if gap <= 0:
+            return timedelta(0)
+        return timedelta(minutes=gap / rate)
+
+
+async def async_remove_rates(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the stored rates of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, _storage_key(entry_id)).async_remove()
+
+
+def _storage_key(entry_id: str) -> str:
+    return f"ducted_hvac.{entry_id}.thermal_rates"
@@ -0,0 +1,133 @@
+"""Temperature trend and vent cycle statistics for ducted_hvac.
+
+Zones are heated and cooled through ducts, so a zone keeps moving for a while
+after its vent closes and overshoots the target. A zone can optionally close
+its vent early. It keeps a few readings at least ``TREND_SPACING`` apart in a
+fixed-size ring buffer, so the buffer covers the same time window whatever
+the sensor's cadence. It fits a rate of change to them and closes the vent
+once the temperature projected one lag ahead crosses the target.
+
+VentCycleStats measures vent toggles per hour and how far each cycle
+overshoots, so the anticipatory mode can be compared with plain hysteresis.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+from homeassistant.components.climate.const import HVACMode
+
+# Readings kept per zone for the rate estimate, and the minimum seconds
+# between kept readings; faster readings replace the newest one
+TREND_SAMPLES = 6
+TREND_SPACING = 30.0
+# Fewer samples or a shorter span (seconds) than this gives no estimate
+MIN_TREND_SAMPLES = 3
+MIN_TREND_SPAN = 60.0
+
+TOGGLE_WINDOW = 3600.0  # seconds; toggles per hour are counted over this
+MAX_TOGGLES = 240  # toggles remembered within the window
+
+
+class TemperatureTrend:
+    """Ring buffer of recent ``(loop time, temperature)`` readings."""
+
+    def __init__(self, size: int = TREND_SAMPLES, spacing: float = TREND_SPACING) -> None:
+        self._samples: deque[tuple[float, float]] = deque(maxlen=size)
+        self._spacing = spacing
+
+    def add(self, when: float, temperature: float) -> None:
+        samples = self._samples
+        if len(samples) >= 2 and samples[-1][0] - samples[-2][0] < self._spacing:
+            # The newest slot is not yet a full spacing on; keep only the latest value
+            samples[-1] = (when, temperature)
+        else:
+            samples.append((when, temperature))
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    def rate(self) -> float | None:
+        """Least-squares slope in degrees per second, or None with too little data."""
+        if len(self._samples) < MIN_TREND_SAMPLES:
+            return None
+        t0 = self._samples[0][0]
+        if self._samples[-1][0] - t0 < MIN_TREND_SPAN:
+            return None
+        n = len(self._samples)
+        mean_t = sum(t - t0 for t, _ in self._samples) / n
+        mean_v = sum(v for _, v in self._samples) / n
+        var = sum((t - t0 - mean_t) ** 2 for t, _ in self._samples)
+        if var == 0:
+            return None
+        cov = sum((t - t0 - mean_t) * (v - mean_v) for t, v in self._samples)
+        return cov / var
+
+    def project(self, now: float, lag: float) -> float | None:
+        """Temperature expected ``lag`` seconds after ``now``, or None if unknown."""
+        if not self._samples or (rate := self.rate()) is None:
+            return None
+        when, temperature = self._samples[-1]
+        return temperature + rate * (now + lag - when)
+
+
+class VentCycleStats:
+    """Counts vent toggles and measures overshoot past the target per cycle.
+
+    A cycle starts when the vent closes in heat or cool mode and ends when
+    it opens again. Its overshoot is how far the zone went past the target
+    in the meantime.
+    """
+
+    def __init__(self) -> None:
+        self._toggles: deque[float] = deque(maxlen=MAX_TOGGLES)
+        self._mode: HVACMode | None = None  # mode of the open cycle, if any
+        self._peak = 0.0
+        self._overshoot_total = 0.0
+        self._cycles = 0
+        self.last_overshoot: float | None = None
+
+    @property
+    def mean_overshoot(self) -> float | None:
+        if not self._cycles:
+            return None
+        return round(self._overshoot_total / self._cycles, 2)
+
+    def toggles_per_hour(self, now: float) -> int:
+        while self._toggles and self._toggles[0] <= now - TOGGLE_WINDOW:
+            self._toggles.popleft()
+        return len(self._toggles)
+
+    def record_toggle(
+        self,
+        now: float,
+        vent_open: bool,
+        hvac_mode: HVACMode,
+        temperature: float | None,
+        target: float,
+    ) -> None:
+        self._toggles.append(now)
+        self._finish()
+        if not vent_open and hvac_mode in (HVACMode.HEAT, HVACMode.COOL):
+            self._mode = hvac_mode
+            self._peak = 0.0
+            if temperature is not None:
+                self.observe(hvac_mode, temperature, target)
+
+    def observe(self, hvac_mode: HVACMode, temperature: float, target: float) -> None:
+        """Feed a reading taken while the vent is closed."""
+        if self._mode is None:
+            return
+        if hvac_mode != self._mode:
+            self._finish()
+            return
+        past = temperature - target if hvac_mode == HVACMode.HEAT else target - temperature
+        self._peak = max(self._peak, past)
+
+    def _finish(self) -> None:
+        if self._mode is None:
+            return
+        self._mode = None
+        self.last_overshoot = round(self._peak, 2)
+        self._overshoot_total += self._peak
+        self._cycles += 1
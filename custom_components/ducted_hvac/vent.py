@@ -0,0 +1,298 @@
+"""Batched vent actuation for ducted_hvac.
+
+Zones hand their vent commands to a VentActuator instead of calling the
+switch services themselves. Commands requested within the same event-loop
+tick (or a short configurable window) go out as one ``switch.turn_on`` and
+one ``switch.turn_off`` call with entity_id lists, and the coordinator is
+notified once for the whole batch.
+
+All actuators share one VentCommandGate, which caps how many vent switches
+are being commanded at once across every config entry and spaces command
+starts, so a burst of vent changes never floods the Zigbee/Z-Wave mesh.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
+
+from homeassistant.core import HomeAssistant, callback
+
+from .resilience import CircuitOpenError, ServiceCaller
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class VentCommandGate:
+    """Domain-wide FIFO cap on vent switches being commanded at once.
+
+    Each config entry registers its limits; the gate applies the strictest:
+    the lowest non-zero in-flight cap and the longest spacing between command
+    starts. Waiters are served strictly in arrival order.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._limits: dict[str, tuple[int, float]] = {}  # entry_id → (max in flight, spacing)
+        self._in_flight = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+        self._next_start = -math.inf  # loop time the next command may start
+
+    @property
+    def capacity(self) -> int:
+        """Maximum switches commanded at once, or 0 for no limit."""
+        caps = [cap for cap, _ in self._limits.values() if cap > 0]
+        return min(caps) if caps else 0
+
+    @property
+    def spacing(self) -> float:
+        """Minimum seconds between command starts."""
+        return max((spacing for _, spacing in self._limits.values()), default=0.0)
+
+    @callback
+    def async_register(self, entry_id: str, max_in_flight: int, spacing: float) -> None:
+        self._limits[entry_id] = (max_in_flight, spacing)
+        self._wake()
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        self._limits.pop(entry_id, None)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, count: int = 1) -> AsyncIterator[None]:
+        """Hold ``count`` in-flight slots (clamped to capacity) for the block."""
+        if (capacity := self.capacity) > 0:
+            count = min(count, capacity)
+        if self._waiters or not self._fits(count):
+            future = self._hass.loop.create_future()
+            self._waiters.append((count, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self._release(count)  # granted just as we were cancelled
+                else:
+                    self._waiters.remove((count, future))
+                raise
+        else:
+            self._in_flight += count
+
+        try:
+            if (spacing := self.spacing) > 0:
+                now = self._hass.loop.time()
+                start = max(now, self._next_start)
+                self._next_start = start + spacing
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+        finally:
+            self._release(count)
+
+    def _fits(self, count: int) -> bool:
+        capacity = self.capacity
+        return capacity <= 0 or self._in_flight + count <= capacity
+
+    def _release(self, count: int) -> None:
+        self._in_flight -= count
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._fits(self._waiters[0][0]):
+            count, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._in_flight += count
+            future.set_result(None)
+
+
+class VentActuator:
+    """Collects vent commands and sends them as bulk switch service calls."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator,
+        caller: ServiceCaller,
+        gate: VentCommandGate,
+        window: float = 0.0,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._caller = caller
+        self._gate = gate
+        self._window = window
+        self._commands_sent = 0
+        self._commands_failed = 0
+        # vent entity_id → zone that last commanded it, for breaker probes
+        self._zones_by_vent: dict = {}
+        # zone → (desired open state, futures awaiting the outcome)
+        self._pending: dict = {}
+        self._flush_handle: asyncio.TimerHandle | asyncio.Handle | None = None
+
+    @property
+    def commands_sent(self) -> int:
+        """Vent switch commands attempted, counted once per switch and direction."""
+        return self._commands_sent
+
+    @property
+    def commands_failed(self) -> int:
+        """Vent switch commands that failed, counted once per switch and direction."""
+        return self._commands_failed
+
+    @callback
+    def async_request(self, zone, open: bool) -> asyncio.Future[bool]:  # noqa: A002
+        """Queue a vent command for ``zone`` and return a future for its outcome.
+
+        A later request for the same zone in the same batch replaces the earlier
+        one; every caller then receives the outcome of the final command.
+        """
+        future: asyncio.Future[bool] = self._hass.loop.create_future()
+        entity_id = zone.vent_entity_id
+        if self._zones_by_vent.get(entity_id) is not zone:
+            self._zones_by_vent[entity_id] = zone
+            self._caller.breaker(entity_id).on_probe = partial(self._async_probe, entity_id)
+
+        _, futures = self._pending.get(zone, (open, []))
+        futures.append(future)
+        self._pending[zone] = (open, futures)
+
+        if self._flush_handle is None:
+            if self._window > 0:
+                self._flush_handle = self._hass.loop.call_later(self._window, self._async_flush)
+            else:
+                self._flush_handle = self._hass.loop.call_soon(self._async_flush)
+        return future
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop queued commands. Awaiting zones see a failed command."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        for _, futures in batch.values():
+            for future in futures:
+                if not future.done():
+                    future.set_result(False)
+
+    @callback
+    def async_forget(self, zone, entity_id: str | None = None) -> None:
+        """Stop acting for ``zone``, which was removed or re-pointed.
+
+        ``entity_id`` is the vent the zone no longer owns, by default its
+        current one. Queued commands for the zone fail, and breaker probes for
+        the vent no longer reach it.
+        """
+        entity_id = entity_id or zone.vent_entity_id
+        if self._zones_by_vent.get(entity_id) is zone:
+            del self._zones_by_vent[entity_id]
+            self._caller.breaker(entity_id).on_probe = None
+        if (pending := self._pending.pop(zone, None)) is not None:
+            for future in pending[1]:
+                if not future.done():
+                    future.set_result(False)
+
+    @callback
+    def _async_probe(self, entity_id: str) -> None:
+        """Let the owning zone retry once the vent's breaker half-opens."""
+        if (zone := self._zones_by_vent.get(entity_id)) is not None:
+            zone.async_recheck_vent()
+
+    @callback
+    def _async_flush(self) -> None:
+        self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._hass.async_create_task(self._async_send(batch))
+
+    async def _async_send(self, batch: dict) -> None:
+        """Send one call per direction and fan the outcome back out to zones."""
+        # Zones sharing a vent collapse into one command per direction
+        opening = list(
+            dict.fromkeys(zone.vent_entity_id for zone, (open_, _) in batch.items() if open_)
+        )
+        closing = list(
+            dict.fromkeys(zone.vent_entity_id for zone, (open_, _) in batch.items() if not open_)
+        )
+
+        failed_on, failed_off = await asyncio.gather(
+            self._async_call("turn_on", opening),
+            self._async_call("turn_off", closing),
+        )
+        failed = failed_on | failed_off
+        self._commands_sent += len(opening) + len(closing)
+        self._commands_failed += len(failed_on) + len(failed_off)
+
+        applied = []
+        for zone, (open_, futures) in batch.items():
+            ok = zone.vent_entity_id not in failed
+            if ok:
+                zone.async_vent_applied(open_)
+                applied.append(zone)
+            for future in futures:
+                if not future.done():
+                    future.set_result(ok)
+
+        if applied:
+            self._coordinator.async_zone_changed(*applied)
+
+    async def _async_call(self, service: str, entity_ids: list[str]) -> set[str]:
+        """Call ``switch.<service>`` for the vents; return the entity IDs that failed.
+
+        Vents whose circuit breaker is open fail fast without being called. If
+        the bulk call fails, each vent is retried on its own (with the caller's
+        retry policy) so a single unreachable switch does not fail the batch.
+        """
+        failed = {e for e in entity_ids if not self._caller.allows(e)}
+        entity_ids = [e for e in entity_ids if e not in failed]
+        if failed:
+            _LOGGER.debug("Circuit open for vents %s, skipping %s", sorted(failed), service)
+        if not entity_ids:
+            return failed
+
+        # Split the bulk call so no chunk exceeds the gate's in-flight cap
+        size = self._gate.capacity or len(entity_ids)
+        chunks = [entity_ids[i : i + size] for i in range(0, len(entity_ids), size)]
+        results = await asyncio.gather(*(self._async_call_chunk(service, c) for c in chunks))
+        return failed.union(*results)
+
+    async def _async_call_chunk(self, service: str, entity_ids: list[str]) -> set[str]:
+        if len(entity_ids) > 1:
+            try:
+                await self._caller.async_call(
+                    "switch",
+                    service,
+                    entity_ids,
+                    retry=False,
+                    slot=partial(self._gate.slot, len(entity_ids)),
+                )
+            except Exception:  # noqa: BLE001
+                _LOGGER.warning(
+                    "Bulk %s of %d vents failed, retrying individually", service, len(entity_ids)
+                )
+            else:
+                return set()
+
+        # Concurrently, so one dead switch's retries don't hold up the others;
+        # the gate still caps how many are in flight, per attempt so a switch
+        # backing off between retries doesn't keep a slot
+        results = await asyncio.gather(
+            *(self._async_call_one(service, entity_id) for entity_id in entity_ids)
+        )
+        return {entity_id for entity_id, ok in zip(entity_ids, results) if not ok}
+
+    async def _async_call_one(self, service: str, entity_id: str) -> bool:
+        try:
+            await self._caller.async_call("switch", service, [entity_id], slot=self._gate.slot)
+        except CircuitOpenError:
+            return False
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to %s vent %s", service, entity_id)
+            return False
+        return True
@@ -0,0 +1,120 @@
+"""Incrementally maintained aggregates over zone state for ducted_hvac.
+
+The coordinator needs the number of open zones, which modes those zones are
+in, and the lowest and highest setpoint across temperature-controlled zones.
+Instead of rescanning every zone on each sync, zones report their state when
+it changes and this index keeps the aggregates up to date.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.climate.const import HVACMode
+
+# Modes whose setpoints feed the motor temperature
+_SETPOINT_MODES = {HVACMode.HEAT, HVACMode.COOL}
+
+# Rebuild a heap once it holds this many times more entries than live setpoints
+_COMPACT_RATIO = 2
+
+
+@dataclass(frozen=True)
+class _ZoneSnapshot:
+    vent_open: bool
+    hvac_mode: HVACMode
+    token: int | None  # heap token of the live setpoint entry, if any
+
+
+class ZoneIndex:
+    """O(1) open counts and O(log N) setpoint extremes over registered zones.
+
+    Setpoints live in a min-heap and a max-heap. Replaced entries are not
+    removed eagerly; each entry carries a token and stale tokens are skipped
+    (and popped) when the heap top is read.
+    """
+
+    def __init__(self) -> None:
+        self._zones: dict[Any, _ZoneSnapshot] = {}
+        self._open_count = 0
+        self._open_modes: Counter[HVACMode] = Counter()
+        self._tokens = itertools.count()
+        self._live: set[int] = set()
+        self._min_heap: list[tuple[float, int]] = []
+        self._max_heap: list[tuple[float, int]] = []
+
+    @property
+    def open_count(self) -> int:
+        """Number of zones whose vent is open."""
+        return self._open_count
+
+    def has_open_mode(self, mode: HVACMode) -> bool:
+        """Return True if at least one open zone is in ``mode``."""
+        return self._open_modes[mode] > 0
+
+    def update(self, zone) -> None:
+        """Record the current state of ``zone``, replacing any previous snapshot."""
+        old = self._zones.get(zone)
+        vent_open = zone.vent_is_open
+        mode = zone.hvac_mode
+        temp = zone.target_temperature
+
+        if old is not None:
+            if old.vent_open:
+                self._open_count -= 1
+                self._open_modes[old.hvac_mode] -= 1
+            if old.token is not None:
+                self._live.discard(old.token)
+
+        if vent_open:
+            self._open_count += 1
+            self._open_modes[mode] += 1
+
+        token = None
+        if temp is not None and mode in _SETPOINT_MODES:
+            token = next(self._tokens)
+            self._live.add(token)
+            heapq.heappush(self._min_heap, (temp, token))
+            heapq.heappush(self._max_heap, (-temp, token))
+
+        self._zones[zone] = _ZoneSnapshot(vent_open, mode, token)
+        self._maybe_compact()
+
+    def remove(self, zone) -> None:
+        """Forget ``zone`` entirely."""
+        old = self._zones.pop(zone, None)
+        if old is None:
+            return
+        if old.vent_open:
+            self._open_count -= 1
+            self._open_modes[old.hvac_mode] -= 1
+        if old.token is not None:
+            self._live.discard(old.token)
+        self._maybe_compact()
+
+    def min_setpoint(self) -> float | None:
+        """Lowest setpoint across zones in a temperature-controlled mode."""
+        return self._peek(self._min_heap)
+
+    def max_setpoint(self) -> float | None:
+        """Highest setpoint across zones in a temperature-controlled mode."""
+        top = self._peek(self._max_heap)
+        return None if top is None else -top
+
+    def _peek(self, heap: list[tuple[float, int]]) -> float | None:
+        while heap and heap[0][1] not in self._live:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _maybe_compact(self) -> None:
+        limit = _COMPACT_RATIO * len(self._live) + 16
+        if len(self._min_heap) > limit:
+            self._min_heap = [e for e in self._min_heap if e[1] in self._live]
+            heapq.heapify(self._min_heap)
+        if len(self._max_heap) > limit:
+            self._max_heap = [e for e in self._max_heap if e[1] in self._live]
+            heapq.heapify(self._max_heap)
@@ -0,0 +1 @@
+"""Tests for the ducted_hvac integration."""
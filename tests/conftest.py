@@ -0,0 +1,9 @@
+"""Fixtures for ducted_hvac tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load custom_components/ducted_hvac in every test."""
+    yield
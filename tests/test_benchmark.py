@@ -0,0 +1,161 @@
+"""Benchmarks on a full ducted_hvac entry with emulated motor, vents and sensors.
+
+Each reports its figure through ``record_property`` (and stdout with ``-s``)
+and asserts a bound that the previous behaviour did not meet.
+"""
+
+import random
+
+import pytest
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, ServiceCall, State, callback
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry, mock_restore_cache
+
+from custom_components.ducted_hvac import DOMAIN
+
+MOTOR = "climate.motor"
+TARGET = 21.0
+
+
+async def async_setup_system(
+    hass: HomeAssistant, zones: int, temperature: float = TARGET
+) -> tuple[MockConfigEntry, list[ServiceCall]]:
+    """Set up an entry whose zones restore in heat at TARGET, with devices that obey.
+
+    Returns the entry and the list the motor's service calls are recorded in.
+    """
+    await async_setup_component(hass, "climate", {})
+    hass.states.async_set(
+        MOTOR, HVACMode.OFF, {"hvac_modes": ["off", "heat", "cool"], "supported_features": 1}
+    )
+
+    motor_calls: list[ServiceCall] = []
+
+    @callback
+    def motor(call: ServiceCall) -> None:
+        motor_calls.append(call)
+        state = hass.states.get(MOTOR)
+        mode = HVACMode.OFF if call.service == "turn_off" else state.state
+        attributes = dict(state.attributes)
+        if "temperature" in call.data:
+            attributes["temperature"] = call.data["temperature"]
+        hass.states.async_set(MOTOR, call.data.get("hvac_mode", mode), attributes)
+
+    @callback
+    def vent(call: ServiceCall) -> None:
+        entity_ids = call.data["entity_id"]
+        for entity_id in [entity_ids] if isinstance(entity_ids, str) else entity_ids:
+            hass.states.async_set(entity_id, "on" if call.service == "turn_on" else "off")
+
+    # Replace the climate services so calls reach the emulated motor
+    for service in ("set_temperature", "set_hvac_mode", "turn_off"):
+        hass.services.async_register("climate", service, motor)
+    for service in ("turn_on", "turn_off"):
+        hass.services.async_register("switch", service, vent)
+
+    for n in range(zones):
+        hass.states.async_set(f"switch.vent_{n}", "off")
+        hass.states.async_set(f"sensor.temp_{n}", str(temperature))
+    mock_restore_cache(
+        hass,
+        [State(f"climate.zone_{n}", HVACMode.HEAT, {"temperature": TARGET}) for n in range(zones)],
+    )
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Ducted HVAC",
+        data={
+            "name": "Ducted HVAC",
+            "motor": MOTOR,
+            "modes": ["off", "heat", "cool"],
+            "zones": [
+                {
+                    "name": f"Zone {n}",
+                    "unique_id": f"zone_{n}",
+                    "vent": f"switch.vent_{n}",
+                    "sensor": f"sensor.temp_{n}",
+                }
+                for n in range(zones)
+            ],
+            "min_temp": 16,
+            "max_temp": 30,
+            "temp_step": 0.5,
+            "tolerance": 0.3,
+            "min_cycle_duration": 0,
+            "fan_modes": [],
+            "sync_quiet_window": 0,
+            "sync_max_delay": 0,
+            "drift_reconcile_interval": 0,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry, motor_calls
+
+
+async def test_tasks_per_1000_sensor_events(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch, record_property
+) -> None:
+    """Readings that leave the vent alone must not allocate a task each.
+
+    Before the inline decision path every reading scheduled a vent-control
+    task, i.e. 1000 per 1000 events.
+    """
+    zones = 4
+    entry, _ = await async_setup_system(hass, zones)
+    actuator = hass.data[DOMAIN][entry.entry_id]["actuator"]
+    rnd = random.Random(0)
+
+    tasks = 0
+    create_task = hass.loop.create_task
+
+    def counting_create_task(*args, **kwargs):
+        nonlocal tasks
+        tasks += 1
+        return create_task(*args, **kwargs)
+
+    monkeypatch.setattr(hass.loop, "create_task", counting_create_task)
+    sent_before = actuator.commands_sent
+    for event in range(1000):
+        value = round(TARGET + rnd.gauss(0, 0.15), 2)
+        hass.states.async_set(f"sensor.temp_{event % zones}", str(value))
+        await hass.async_block_till_done()
+    monkeypatch.undo()
+    toggles = actuator.commands_sent - sent_before
+
+    record_property("tasks_per_1000_events", tasks)
+    record_property("vent_toggles", toggles)
+    print(f"\n{tasks} tasks for 1000 sensor events ({toggles} vent toggles)")
+    assert toggles > 0
+    assert tasks < 1000 / 5
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_time_to_steady_state_after_restart(hass: HomeAssistant, record_property) -> None:
+    """After a restart with every zone below target, one motor sync reaches steady state.
+
+    Before the startup barrier each zone's startup check synced the motor on
+    its own, so the first zones drove it with partial information.
+    """
+    zones = 8
+    started = hass.loop.time()
+    entry, motor_calls = await async_setup_system(hass, zones, temperature=TARGET - 1)
+    elapsed = hass.loop.time() - started
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    assert all(hass.states.get(f"switch.vent_{n}").state == "on" for n in range(zones))
+    motor = hass.states.get(MOTOR)
+    assert (motor.state, motor.attributes["temperature"]) == (HVACMode.HEAT, TARGET)
+
+    record_property("time_to_steady_state", elapsed)
+    record_property("startup_duration", coordinator.startup_duration)
+    record_property("startup_motor_calls", len(motor_calls))
+    print(
+        f"\nsteady state {elapsed * 1000:.1f} ms after setup "
+        f"(startup_duration {coordinator.startup_duration}s), {len(motor_calls)} motor call(s)"
+    )
+    assert coordinator.startup_duration is not None
+    assert len(motor_calls) == 1
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,87 @@
+"""Tests for motor command planning in the MotorCoordinator."""
+
+import asyncio
+
+import pytest
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from custom_components.ducted_hvac import MotorCoordinator
+from custom_components.ducted_hvac.resilience import ServiceCaller
+
+MOTOR = "climate.motor"
+
+
+class FakeZone:
+    def __init__(self, hvac_mode: HVACMode, target_temperature: float) -> None:
+        self.entity_id = self.unique_id = "climate.zone"
+        self.vent_is_open = True
+        self.hvac_mode = hvac_mode
+        self.target_temperature = target_temperature
+
+    def async_startup_check(self) -> None:
+        return None
+
+    def async_recheck_vent(self) -> None:
+        return None
+
+
+async def test_unsupported_mode_sends_nothing(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A mode the motor lacks leaves it alone instead of sending that mode's setpoint."""
+    hass.states.async_set(
+        MOTOR,
+        HVACMode.COOL,
+        {"hvac_modes": ["off", "cool", "fan_only"], "supported_features": 1, "temperature": 24},
+    )
+    calls: list[ServiceCall] = []
+    for service in ("set_temperature", "set_hvac_mode", "turn_off"):
+        hass.services.async_register("climate", service, calls.append)
+    caller = ServiceCaller(hass, timeout=5, retries=0, failure_threshold=5, reset_timeout=60)
+    coordinator = MotorCoordinator(
+        hass, MOTOR, caller, quiet_window=0, max_delay=0, reconcile_interval=0
+    )
+    coordinator.async_start()
+    coordinator.register_zone(zone := FakeZone(HVACMode.HEAT, 27))
+
+    coordinator.async_zone_changed(zone, flush=True)
+    await asyncio.sleep(0.05)
+    coordinator.async_zone_changed(zone, flush=True)
+    await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+
+    assert calls == []
+    assert coordinator.last_active_mode is None
+    assert caplog.text.count("does not support heat") == 1
+    coordinator.async_shutdown()
+
+
+async def test_confirm_timeout_does_not_open_breaker(hass: HomeAssistant) -> None:
+    """A motor that accepts calls but never reports them is not tripped open."""
+    hass.states.async_set(MOTOR, HVACMode.OFF, {"supported_features": 1})
+    calls: list[ServiceCall] = []
+    for service in ("set_temperature", "set_hvac_mode", "turn_off"):
+        hass.services.async_register("climate", service, calls.append)
+    caller = ServiceCaller(hass, timeout=5, retries=0, failure_threshold=1, reset_timeout=60)
+    coordinator = MotorCoordinator(
+        hass,
+        MOTOR,
+        caller,
+        quiet_window=0,
+        max_delay=0,
+        dispatch="pipelined",
+        confirm_timeout=0.01,
+        reconcile_interval=0,
+    )
+    coordinator.async_start()
+    coordinator.register_zone(zone := FakeZone(HVACMode.COOL, 22))
+
+    for _ in range(3):
+        coordinator.async_zone_changed(zone, flush=True)
+        await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+
+    assert len(calls) >= 3
+    assert caller.breaker_states == {}
+    coordinator.async_shutdown()
@@ -0,0 +1,56 @@
+"""Tests for the motor command rate limiter."""
+
+import asyncio
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ducted_hvac.planner import MotorCommand
+from custom_components.ducted_hvac.ratelimit import MotorCommandQueue
+
+
+def _queue(
+    hass: HomeAssistant, sent: list[MotorCommand]
+) -> tuple[MotorCommandQueue, Callable[[MotorCommand], asyncio.Future[bool]]]:
+    queue = MotorCommandQueue(hass, interval=0.01)
+
+    def submit(command: MotorCommand) -> asyncio.Future[bool]:
+        async def send() -> bool:
+            sent.append(command)
+            return True
+
+        return queue.async_submit(command, send)
+
+    return queue, submit
+
+
+async def test_mode_with_setpoint_replaces_queued_setpoint(hass: HomeAssistant) -> None:
+    """A folded mode+setpoint must not be followed by an older setpoint-only command."""
+    sent: list[MotorCommand] = []
+    queue, submit = _queue(hass, sent)
+
+    submit(MotorCommand("set_temperature", {"hvac_mode": "heat", "temperature": 24}))
+    submit(MotorCommand("set_temperature", {"temperature": 20}))
+    last = submit(MotorCommand("set_temperature", {"hvac_mode": "heat", "temperature": 25}))
+
+    assert await last
+    assert sent == [MotorCommand("set_temperature", {"hvac_mode": "heat", "temperature": 25})]
+    assert queue.merged == 2
+
+
+async def test_replaced_command_moves_to_the_back(hass: HomeAssistant) -> None:
+    """A replaced command is sent after commands queued before its replacement."""
+    sent: list[MotorCommand] = []
+    queue, submit = _queue(hass, sent)
+
+    submit(MotorCommand("set_temperature", {"temperature": 20}))
+    submit(MotorCommand("set_fan_mode", {"fan_mode": "low"}))
+    last = submit(MotorCommand("set_temperature", {"temperature": 22}))
+
+    assert await last
+    assert sent == [
+        MotorCommand("set_fan_mode", {"fan_mode": "low"}),
+        MotorCommand("set_temperature", {"temperature": 22}),
+    ]
+    assert queue.merged == 1
+    assert queue.depth == 0
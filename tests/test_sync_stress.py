@@ -0,0 +1,139 @@
+"""Stress test: bursts of zone changes leave the motor in the state the zones imply.
+
+Zones change at random while an emulated motor applies each command late and
+in order. Once the coordinator settles, the motor must match the final zone
+set, for every dispatch mode with and without the rate limiter.
+"""
+
+import asyncio
+import random
+
+import pytest
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from custom_components.ducted_hvac import MODE_PRIORITY, MotorCoordinator
+from custom_components.ducted_hvac.resilience import ServiceCaller
+from custom_components.ducted_hvac.zone_index import _SETPOINT_MODES
+
+MOTOR = "climate.motor"
+MODES = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.DRY, HVACMode.FAN_ONLY]
+ZONES = 5
+CHANGES = 100
+MOTOR_LAG = 0.05  # longest a command takes to show on the motor's state
+
+
+class FakeZone:
+    """The parts of a zone the coordinator reads."""
+
+    def __init__(self, n: int) -> None:
+        self.entity_id = f"climate.zone_{n}"
+        self.unique_id = self.entity_id
+        self.vent_is_open = False
+        self.hvac_mode = HVACMode.OFF
+        self.target_temperature = 21.0
+
+    def async_startup_check(self) -> None:
+        return None
+
+    def async_recheck_vent(self) -> None:
+        return None
+
+
+def expected(zones: list[FakeZone]) -> tuple[str, float | None]:
+    """Motor mode and setpoint for ``zones``, derived independently of the planner."""
+    open_zones = [z for z in zones if z.vent_is_open]
+    if not open_zones:
+        return HVACMode.OFF, None
+    mode = next(
+        (m for m in MODE_PRIORITY if any(z.hvac_mode == m for z in open_zones)),
+        HVACMode.FAN_ONLY,
+    )
+    temps = [z.target_temperature for z in zones if z.hvac_mode in _SETPOINT_MODES]
+    if mode == HVACMode.COOL:
+        return mode, min(temps) if temps else None
+    if mode == HVACMode.HEAT:
+        return mode, max(temps) if temps else None
+    return mode, None
+
+
+def emulate_motor(hass: HomeAssistant, rnd: random.Random) -> None:
+    """Register climate services that apply to MOTOR late, in the order received."""
+    hass.states.async_set(
+        MOTOR,
+        HVACMode.OFF,
+        {
+            "hvac_modes": [m.value for m in MODES],
+            "supported_features": 1,
+            "min_temp": 16,
+            "max_temp": 30,
+            "target_temp_step": 0.5,
+        },
+    )
+    lock = asyncio.Lock()
+
+    async def handle(call: ServiceCall) -> None:
+        async with lock:
+            await asyncio.sleep(rnd.uniform(0, MOTOR_LAG))
+            state = hass.states.get(MOTOR)
+            mode = HVACMode.OFF if call.service == "turn_off" else state.state
+            mode = call.data.get("hvac_mode", mode)
+            attributes = dict(state.attributes)
+            if "temperature" in call.data:
+                attributes["temperature"] = call.data["temperature"]
+            hass.states.async_set(MOTOR, mode, attributes)
+
+    for service in ("set_temperature", "set_hvac_mode", "turn_off", "set_fan_mode"):
+        hass.services.async_register("climate", service, handle)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("interval", [0.0, 0.02])
+@pytest.mark.parametrize("dispatch", ["sequential", "pipelined"])
+async def test_motor_matches_zones_after_burst(
+    hass: HomeAssistant, dispatch: str, interval: float, seed: int
+) -> None:
+    rnd = random.Random(seed)
+    emulate_motor(hass, rnd)
+    caller = ServiceCaller(hass, timeout=5, retries=0, failure_threshold=100, reset_timeout=60)
+    coordinator = MotorCoordinator(
+        hass,
+        MOTOR,
+        caller,
+        quiet_window=0.02,
+        max_delay=0.1,
+        dispatch=dispatch,
+        confirm_timeout=2,
+        command_interval=interval,
+        reconcile_interval=0,
+        expected_zones=ZONES,
+    )
+    coordinator.async_start()
+    zones = [FakeZone(n) for n in range(ZONES)]
+    for zone in zones:
+        coordinator.register_zone(zone)
+
+    for _ in range(CHANGES):
+        zone = rnd.choice(zones)
+        what = rnd.random()
+        if what < 0.4:
+            zone.vent_is_open = not zone.vent_is_open
+        elif what < 0.7:
+            zone.hvac_mode = rnd.choice(MODES)
+        else:
+            zone.target_temperature = rnd.choice([x / 2 for x in range(34, 60)])
+        coordinator.async_zone_changed(zone, flush=rnd.random() < 0.2)
+        await asyncio.sleep(rnd.uniform(0, 0.01))
+
+    for _ in range(200):
+        await asyncio.sleep(0.05)
+        if not coordinator._syncing and coordinator._unsub_sync_timer is None:
+            break
+    await hass.async_block_till_done()
+
+    want_mode, want_temp = expected(zones)
+    state = hass.states.get(MOTOR)
+    assert state.state == want_mode
+    if want_temp is not None:
+        assert state.attributes["temperature"] == pytest.approx(want_temp)
+    coordinator.async_shutdown()
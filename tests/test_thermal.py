@@ -0,0 +1,53 @@
+"""Tests for the learned thermal rates."""
+
+from typing import Any
+
+import pytest
+from homeassistant.components.climate.const import HVACMode
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ducted_hvac import DOMAIN
+from custom_components.ducted_hvac.thermal import ThermalRateLearner
+
+
+async def test_rates_deleted_with_entry(
+    hass: HomeAssistant, hass_storage: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Removing an entry deletes its rates, including ones learned since the last save."""
+    hass.states.async_set("climate.motor", HVACMode.OFF)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "name": "Ducted HVAC",
+            "motor": "climate.motor",
+            "modes": ["off", "heat"],
+            "zones": [],
+            "min_temp": 16,
+            "max_temp": 30,
+            "temp_step": 0.5,
+            "tolerance": 0.3,
+            "min_cycle_duration": 0,
+            "fan_modes": [],
+        },
+    )
+    key = f"ducted_hvac.{entry.entry_id}.thermal_rates"
+    hass_storage[key] = {"version": 1, "key": key, "data": {"zone": {"heat": 0.1}}}
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    thermal: ThermalRateLearner = hass.data[DOMAIN][entry.entry_id]["thermal"]
+    assert thermal.rate("zone", HVACMode.HEAT) == 0.1
+    now = hass.loop.time()
+    monkeypatch.setattr(hass.loop, "time", lambda: now)
+    thermal.async_observe("zone", HVACMode.HEAT, True, 20.0)
+    now += 120
+    thermal.async_observe("zone", HVACMode.HEAT, True, 20.4)
+    monkeypatch.undo()
+    assert thermal.rate("zone", HVACMode.HEAT) != 0.1
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
@@ -0,0 +1,61 @@
+"""Tests for vent command gating."""
+
+import asyncio
+
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from custom_components.ducted_hvac.resilience import ServiceCaller
+from custom_components.ducted_hvac.vent import VentActuator, VentCommandGate
+
+
+class FakeZone:
+    def __init__(self, vent_entity_id: str) -> None:
+        self.vent_entity_id = vent_entity_id
+        self.applied: list[bool] = []
+
+    def async_vent_applied(self, open_: bool) -> None:
+        self.applied.append(open_)
+
+
+class FakeCoordinator:
+    def async_zone_changed(self, *zones) -> None:
+        return None
+
+
+async def test_gate_slot_is_released_between_retries(hass: HomeAssistant) -> None:
+    """A vent backing off between retries must not hold the only in-flight slot."""
+    calls: list[str] = []
+
+    async def turn_on(call: ServiceCall) -> None:
+        entity_id = call.data["entity_id"]
+        calls.append(entity_id)
+        if entity_id == "switch.dead" and calls.count(entity_id) == 1:
+            raise RuntimeError("no ack")
+
+    hass.services.async_register("switch", "turn_on", turn_on)
+    gate = VentCommandGate(hass)
+    gate.async_register("entry", 1, 0.0)
+    caller = ServiceCaller(
+        hass, timeout=5, retries=1, failure_threshold=5, reset_timeout=60, backoff=0.2
+    )
+
+    await asyncio.gather(
+        caller.async_call("switch", "turn_on", ["switch.dead"], slot=gate.slot),
+        caller.async_call("switch", "turn_on", ["switch.live"], slot=gate.slot),
+    )
+
+    assert calls == ["switch.dead", "switch.live", "switch.dead"]
+
+
+async def test_commands_counted_once_per_switch(hass: HomeAssistant) -> None:
+    """Zones sharing a vent send, and count, one command for it."""
+    hass.services.async_register("switch", "turn_on", lambda call: None)
+    caller = ServiceCaller(hass, timeout=5, retries=0, failure_threshold=5, reset_timeout=60)
+    actuator = VentActuator(hass, FakeCoordinator(), caller, VentCommandGate(hass))
+    zones = [FakeZone("switch.shared"), FakeZone("switch.shared"), FakeZone("switch.own")]
+
+    results = await asyncio.gather(*(actuator.async_request(zone, True) for zone in zones))
+
+    assert results == [True, True, True]
+    assert actuator.commands_sent == 2
+    assert actuator.commands_failed == 0